@@ -288,9 +288,7 @@ def addColourAttribute(graph: Models.CommonGraphApi, colour : Colour, nodes = Fa
             # colour what is in `edges`
             edgesToColour = edges
         
-        attributeDict = dict()
-        for edge in edgesToColour:
-            attributeDict[edge] = colour.value
+        attributeDict = dict.fromkeys(edgesToColour, colour.value)
         
         networkx.set_edge_attributes(nxGraph, attributeDict, COLOUR_NAME)
     
@@ -304,9 +302,7 @@ def addColourAttribute(graph: Models.CommonGraphApi, colour : Colour, nodes = Fa
             # colour what is in `nodes`
             nodesToColour = nodes
         
-        attributeDict = dict()
-        for node in nodesToColour:
-            attributeDict[node] = colour.value
+        attributeDict = dict.fromkeys(nodesToColour, colour.value)
         
         networkx.set_node_attributes(nxGraph, attributeDict, COLOUR_NAME)
 
@@ -157,6 +157,7 @@ class Path():#TODO: omptimise memory usage, especially when there are tens of th
         """
         # finalise mutable path
         self.path = tuple(mutablePath.path)
+        self._hash = hash(self.path) # the path never changes, hash it only once. Set operations on paths hash them over and over again.
     
     @property
     def nodes(self):
@@ -209,8 +210,10 @@ class Path():#TODO: omptimise memory usage, especially when there are tens of th
         return len(self.nodes)
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(self, other.__class__):
-            return self.path == other.path
+            return self.__hash__() == other.__hash__() and self.path == other.path # differing hashes rule out equality without comparing every step
         return False
         
     def __ne__(self, other):
@@ -223,7 +226,17 @@ class Path():#TODO: omptimise memory usage, especially when there are tens of th
         return self.__str__()
     
     def __hash__(self):
-        return self.path.__hash__()
+        try:
+            return self._hash
+        except AttributeError: # unpickled
+            self._hash = hash(self.path)
+            return self._hash
+    
+    def __getstate__(self):
+        # string hashes differ between processes, never carry the cached hash into another process or a cache file
+        state = self.__dict__.copy()
+        state.pop('_hash', None)
+        return state
 
 
 class MarkedPath(Path):
@@ -263,6 +276,7 @@ class MarkedPath(Path):
         
         # copy from Path
         self.path = path.path
+        self._hash = path.__hash__()
         
         # new attributes
         self.specialKeys = None
@@ -270,32 +284,33 @@ class MarkedPath(Path):
         self.specialNodes = None
         
         if specialKeys is not None:
-            self.specialKeys = set()
+            if not isinstance(specialKeys, (set, frozenset)):
+                specialKeys = frozenset(specialKeys)
+            
             self.parallelSpecialKeys = dict()
+            singleEdges = []
             
             # search path for special edges
             for edge in path.edges: # iterate (multi-)edges of path
                 
                 if not isinstance(edge, Elements.Element): # multi-edge
                     
-                    for key in edge:
-                        if key in specialKeys:
-                            self.specialKeys.add(key)
-                            self.parallelSpecialKeys[key] = len(edge)
+                    for key in specialKeys.intersection(edge):
+                        self.parallelSpecialKeys[key] = len(edge)
                             
                 else: # single edge
-                    
-                    if edge in specialKeys:
-                        self.specialKeys.add(edge)
+                    singleEdges.append(edge)
+            
+            # intersect all single edges at once, instead of testing each one
+            self.specialKeys = set(self.parallelSpecialKeys)
+            self.specialKeys.update(specialKeys.intersection(singleEdges))
 
         if specialNodes is not None:
-            self.specialNodes = set()
+            if not isinstance(specialNodes, (set, frozenset)):
+                specialNodes = frozenset(specialNodes)
             
             # search path for special nodes
-            for node in path.nodes:
-                
-                if node in specialNodes:
-                    self.specialNodes.add(node)
+            self.specialNodes = set(specialNodes.intersection(path.nodes))
     
     @property
     def hasSpecialKey(self) -> bool:
@@ -567,12 +582,19 @@ class CommonGraphApi(object):
         NotImplementedError
             If this function has not been adapted to the chosen graph implementation, yet. See :attr:`implementationLib`.
         """
-        edges = self.getEdges()
-        elementSet = set()
-        for edge in edges:
-            _, _, element = edge
-            elementSet.add(element)
-        return elementSet
+        # NetworkX was chosen as graph implementation
+        if self.__class__.implementationGraph == MultiDiGraph:
+            
+            # read edge keys straight from the adjacency, instead of building a tuple for every edge
+            elementSet = set()
+            for successors in self.underlyingRawGraph.adj.values():
+                for keys in successors.values():
+                    elementSet.update(keys)
+            return elementSet
+        
+        # unknown implementation
+        else:
+            raise NotImplementedError
     
     def addNode(self, node: Elements.Element):
         """
@@ -1653,17 +1675,17 @@ class CommonGraphApi(object):
                 
                 
                 result = set()
+                adjacency = self.underlyingRawGraph.adj # look up parallel edge keys directly, instead of building a set of edge tuples for every step
                 
                 for nodeList in nodeLists:
                     
-                    lastNode = nodeList.pop(0) # remove fromNode
+                    lastNode = nodeList[0] # fromNode
                     path = None
                     
-                    for node in nodeList: # iterate over next nodes
-                        edges = self.getEdges(fromNode = lastNode, toNode = node)
+                    for node in nodeList[1:]: # iterate over next nodes
+                        keys = set(adjacency[lastNode].get(node, ()))
                         
-                        if len(edges) > 0: # there are edges, continue path
-                            keys = {edge[2] for edge in edges}
+                        if len(keys) > 0: # there are edges, continue path
                             
                             if path is None: # first round
                                 path = MutablePath(lastNode, keys, node)
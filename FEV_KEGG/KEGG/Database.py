@@ -1725,7 +1725,7 @@ def getSubstanceBulk(substances: Iterable[SubstanceID]) -> Dict[str, Substance]:
     """
     Get multiple substance descriptions.
     
-    Downloads the data from KEGG in bulk, if not already present on disk. This is done in parallel in a thread pool, see :attr:`FEV_KEGG.settings.downloadThreads`.
+    Downloads the data from KEGG in bulk, if not already present on disk, with up to 10 entries per request. This is done in parallel in a thread pool, see :attr:`FEV_KEGG.settings.downloadThreads`.
     
     Parameters
     ----------
@@ -1788,25 +1788,33 @@ def getSubstanceBulk(substances: Iterable[SubstanceID]) -> Dict[str, Substance]:
         try:
             # query KEGG in parallel
             
-            for substance in substancesToDownload:
-                futures.append( threadPool.submit(_downloadSubstance, substance) )
+            max_query_count = 10 # hard limit imposed by KEGG server
+            chunkCount = 0
+            
+            for chunk in chunks(substancesToDownload, max_query_count):
+                futures.append( threadPool.submit(_downloadSubstance, chunk) )
+                chunkCount += 1
             
             iterator = concurrent.futures.as_completed(futures)
             
             if settings.verbosity >= 1:
                 if settings.verbosity >= 2:
-                    print( 'Downloading ' + str(len(substancesToDownload)) + ' substances...' )
-                iterator = tqdm.tqdm(iterator, total = len(substancesToDownload), unit = ' substances', position = tqdmPosition)
+                    print( 'Downloading ' + str(len(substancesToDownload)) + ' substances, max. ' + str(max_query_count) + ' per chunk...' )
+                iterator = tqdm.tqdm(iterator, total = chunkCount, unit = ' chunks', position = tqdmPosition)
                 
             for future in iterator:
                 
                 result_part = future.result()
                 if result_part is not None:
-                    substance = Substance(result_part)
-                    substancesDict[substance.uniqueID] = substance
-                    
-                    fileName = 'substance/' + substance.uniqueID
-                    File.writeToFile(result_part, fileName)
+                    for substanceText in re.split('///\n', result_part)[:-1]:
+                        
+                        substanceText += '///\n'
+                        
+                        substance = Substance(substanceText)
+                        substancesDict[substance.uniqueID] = substance
+                        
+                        fileName = 'substance/' + substance.uniqueID
+                        File.writeToFile(substanceText, fileName)
             
             threadPool.shutdown(wait = False)
             
@@ -1828,12 +1836,12 @@ def getSubstanceBulk(substances: Iterable[SubstanceID]) -> Dict[str, Substance]:
     return substancesDict
 
 
-def _downloadSubstance(substance):
+def _downloadSubstance(substanceChunk):
     if Parallelism.getShallCancelThreads() is True:
         raise concurrent.futures.CancelledError()
     else:
         try:
-            substance = Download.downloadSubstance(substance.uniqueID)
+            substance = Download.downloadSubstanceChunk([substance.uniqueID for substance in substanceChunk])
         except urllib.error.HTTPError as exception:
             if isinstance(exception, urllib.error.HTTPError) and exception.code == 404:
                 return None
@@ -1847,7 +1855,7 @@ def getEcEnzymeBulk(ecNumbers: Iterable[EcNumber]) -> Dict[str, EcEnzyme]:
     """
     Get multiple enzyme descriptions, defined by its EC number.
     
-    Downloads the data from KEGG in bulk, if not already present on disk. This is done in parallel in a thread pool, see :attr:`FEV_KEGG.settings.downloadThreads`.
+    Downloads the data from KEGG in bulk, if not already present on disk, with up to 10 entries per request. This is done in parallel in a thread pool, see :attr:`FEV_KEGG.settings.downloadThreads`.
     
     Parameters
     ----------
@@ -1914,25 +1922,33 @@ def getEcEnzymeBulk(ecNumbers: Iterable[EcNumber]) -> Dict[str, EcEnzyme]:
         try:
             # query KEGG in parallel
             
-            for ecNumber in ecEnzymesToDownload:
-                futures.append( threadPool.submit(_downloadEcEnzyme, ecNumber) )
+            max_query_count = 10 # hard limit imposed by KEGG server
+            chunkCount = 0
+            
+            for chunk in chunks(ecEnzymesToDownload, max_query_count):
+                futures.append( threadPool.submit(_downloadEcEnzyme, chunk) )
+                chunkCount += 1
             
             iterator = concurrent.futures.as_completed(futures)
             
             if settings.verbosity >= 1:
                 if settings.verbosity >= 2:
-                    print( 'Downloading ' + str(len(ecEnzymesToDownload)) + ' EcEnzymes...' )
-                iterator = tqdm.tqdm(iterator, total = len(ecEnzymesToDownload), unit = ' EcEnzymes', position = tqdmPosition)
+                    print( 'Downloading ' + str(len(ecEnzymesToDownload)) + ' EcEnzymes, max. ' + str(max_query_count) + ' per chunk...' )
+                iterator = tqdm.tqdm(iterator, total = chunkCount, unit = ' chunks', position = tqdmPosition)
                 
             for future in iterator:
                 
                 result_part = future.result()
                 if result_part is not None:
-                    ecEnzyme = EcEnzyme(result_part)
-                    ecEnzymesDict[ecEnzyme.uniqueID] = ecEnzyme
-                    
-                    fileName = 'EC_number/' + ecEnzyme.uniqueID
-                    File.writeToFile(result_part, fileName)
+                    for ecEnzymeText in re.split('///\n', result_part)[:-1]:
+                        
+                        ecEnzymeText += '///\n'
+                        
+                        ecEnzyme = EcEnzyme(ecEnzymeText)
+                        ecEnzymesDict[ecEnzyme.uniqueID] = ecEnzyme
+                        
+                        fileName = 'EC_number/' + ecEnzyme.uniqueID
+                        File.writeToFile(ecEnzymeText, fileName)
             
             threadPool.shutdown(wait = False)
             
@@ -1954,12 +1970,12 @@ def getEcEnzymeBulk(ecNumbers: Iterable[EcNumber]) -> Dict[str, EcEnzyme]:
     return ecEnzymesDict
 
 
-def _downloadEcEnzyme(ecNumber: EcNumber):
+def _downloadEcEnzyme(ecNumberChunk: List[EcNumber]):
     if Parallelism.getShallCancelThreads() is True:
         raise concurrent.futures.CancelledError()
     else:
         try:
-            ecEnzyme = Download.downloadEcEnzyme(ecNumber.uniqueID)
+            ecEnzyme = Download.downloadEcEnzymeChunk([ecNumber.uniqueID for ecNumber in ecNumberChunk])
         except urllib.error.HTTPError as exception:
             if isinstance(exception, urllib.error.HTTPError) and exception.code == 404:
                 return None
@@ -33,7 +33,7 @@ def is_not_404(exception):
     return not ( isinstance(exception, urllib.error.HTTPError) and exception.code == 404 )
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404)
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404)
 def downloadPathwayList(organismString: 'eco') -> str:
     """
     Downloads list of all pathways for a given organism from KEGG.
@@ -57,10 +57,10 @@ def downloadPathwayList(organismString: 'eco') -> str:
     URLError
         If connection to KEGG fails.
     """
-    return REST.kegg_list('pathway', organismString, timeout=settings.downloadTimeoutSocket).read()
+    return REST.kegg_list('pathway', organismString, timeout=settings.downloadTimeout).read()
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
 def downloadPathway(organismString: 'eco', pathwayName: '00260') -> str:
     """
     Downloads pathway as KGML for a given organism from KEGG.
@@ -86,10 +86,10 @@ def downloadPathway(organismString: 'eco', pathwayName: '00260') -> str:
     URLError
         If connection to KEGG fails.
     """
-    return REST.kegg_get(organismString + pathwayName, 'kgml', timeout=settings.downloadTimeoutSocket).read()
+    return REST.kegg_get(organismString + pathwayName, 'kgml', timeout=settings.downloadTimeout).read()
     
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax)
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax)
 def downloadGene(geneID: 'eco:b0004') -> str:
     """
     Downloads gene description for a given gene ID (includes organism) from KEGG.
@@ -113,7 +113,7 @@ def downloadGene(geneID: 'eco:b0004') -> str:
     URLError
         If connection to KEGG fails.
     """
-    result = REST.kegg_get(geneID, timeout=settings.downloadTimeoutSocket).read()
+    result = REST.kegg_get(geneID, timeout=settings.downloadTimeout).read()
     if len( result ) < 3:
         raise urllib.error.HTTPError( "Download too small:\n" + result)
     else:
@@ -197,19 +197,19 @@ def downloadGeneBulk(geneIDs: '[eco:b0004, eco:b0015,...]') -> str:
     
     return result
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax)
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax)
 def _downloadGeneBulk(query_part):
     if Parallelism.getShallCancelThreads() is True:
         raise concurrent.futures.CancelledError()
     else:
-        result = REST.kegg_get(query_part, timeout=settings.downloadTimeoutSocket).read()
+        result = REST.kegg_get(query_part, timeout=settings.downloadTimeout).read()
         if len( result ) < 3:
             raise IOError( "Download too small:\n" + result)
         else:
             return result
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax)
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax)
 def downloadOrganismList() -> str:
     """
     Download the list of all organisms known to KEGG.
@@ -226,10 +226,10 @@ def downloadOrganismList() -> str:
     URLError
         If connection to KEGG fails.
     """
-    return REST.kegg_list('organism', timeout=settings.downloadTimeoutSocket).read()
+    return REST.kegg_list('organism', timeout=settings.downloadTimeout).read()
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
 def downloadEnzymeEcNumbers(enzymeAbbreviation) -> str:
     """
     Download the list of all EC numbers for a given enzyme, identified by its abbreviation, from KEGG.
@@ -255,7 +255,7 @@ def downloadEnzymeEcNumbers(enzymeAbbreviation) -> str:
     ecNumbers = []
     
     # look up enzyme EC numbers
-    searchResult = REST.kegg_find('enzyme', enzymeAbbreviation, timeout=settings.downloadTimeoutSocket).read().split('\n')
+    searchResult = REST.kegg_find('enzyme', enzymeAbbreviation, timeout=settings.downloadTimeout).read().split('\n')
     for line in searchResult:
         
         if len( line ) < 10:
@@ -267,7 +267,7 @@ def downloadEnzymeEcNumbers(enzymeAbbreviation) -> str:
     return '\n'.join(ecNumbers)
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
 def downloadOrganismInfo(organismAbbreviation) -> str:
     """
     Downloads the info file of an organism.
@@ -288,7 +288,7 @@ def downloadOrganismInfo(organismAbbreviation) -> str:
         If connection to KEGG fails.
     """
     try:
-        return REST.kegg_info(organismAbbreviation, timeout=settings.downloadTimeoutSocket).read()
+        return REST.kegg_info(organismAbbreviation, timeout=settings.downloadTimeout).read()
     except urllib.error.HTTPError as e:
         if isinstance(e, urllib.error.HTTPError) and e.code == 400:
             return None
@@ -371,9 +371,9 @@ def downloadParalogs(geneID: 'GeneID') -> Tuple[int, List[SSDB.PreMatch]]:
     
     return (searchedSequenceLength, foundGenes)
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactorSSDB, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
 def _downloadHomologs(geneIdString, organismAbbreviationString):
-    return str(urllib.request.urlopen('https://www.kegg.jp/ssdb-bin/ssdb_ortholog_view?org_gene=' + geneIdString + '&org=' + organismAbbreviationString, timeout=settings.downloadTimeoutSocket).read()).replace('\\n', '')
+    return str(REST.urlopen_keep_alive('https://www.kegg.jp/ssdb-bin/ssdb_ortholog_view?org_gene=' + geneIdString + '&org=' + organismAbbreviationString, timeout=settings.downloadTimeout).read()).replace('\\n', '')
 
 AA_SEQ_LENGTH_REGEX_PATTERN = re.compile('\(([0-9]+) a\.a\.\)')
 NT_SEQ_LENGTH_REGEX_PATTERN = re.compile('\(([0-9]+) n\.t\.\)') # length in AA == length in NT / 3 - 1
@@ -453,9 +453,9 @@ def downloadOrthologOverview(geneID: 'GeneID') -> Tuple[int, List[SSDB.Match]]:
     
     return foundGenes
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactorSSDB, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
 def _downloadOrthologOverview(geneIdString):
-    return str(urllib.request.urlopen('https://www.kegg.jp/ssdb-bin/ssdb_best_best?threshold=400&org_gene=' + geneIdString, timeout=settings.downloadTimeoutSocket).read()).replace('\\n', '')
+    return str(REST.urlopen_keep_alive('https://www.kegg.jp/ssdb-bin/ssdb_best_best?threshold=400&org_gene=' + geneIdString, timeout=settings.downloadTimeout).read()).replace('\\n', '')
 
 SSDB_OVERVIEW_REGEX = re.compile("\)\s*|\s*[\(]{0,1}\s*")
 
@@ -507,7 +507,7 @@ def _parseSsdbBestView(htmlString) -> Tuple[int, List[SSDB.Match]]:
 
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax)
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax)
 def downloadTaxonomyNCBI() -> str:
     """
     Download NCBI taxonomy from KEGG BRITE.
@@ -522,10 +522,10 @@ def downloadTaxonomyNCBI() -> str:
     URLError
         If connection to KEGG fails.
     """
-    return REST.kegg_get('br:br08610', timeout=settings.downloadTimeoutSocket).read()
+    return REST.kegg_get('br:br08610', timeout=settings.downloadTimeout).read()
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax)
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax)
 def downloadTaxonomyKEGG():
     """
     Download KEGG taxonomy from KEGG BRITE.
@@ -540,11 +540,11 @@ def downloadTaxonomyKEGG():
     URLError
         If connection to KEGG fails.
     """
-    return REST.kegg_get('br:br08601', timeout=settings.downloadTimeoutSocket).read()
+    return REST.kegg_get('br:br08601', timeout=settings.downloadTimeout).read()
 
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
 def downloadSubstance(substanceID):
     """
     Download a substance description file from KEGG, compound or glycan.
@@ -564,10 +564,10 @@ def downloadSubstance(substanceID):
     URLError
         If connection to KEGG fails.
     """
-    return REST.kegg_get(substanceID, timeout=settings.downloadTimeoutSocket).read()
+    return REST.kegg_get(substanceID, timeout=settings.downloadTimeout).read()
 
 
-@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
 def downloadEcEnzyme(ecNumberID):
     """
     Download an enzyme description file from KEGG, defined by its EC number.
@@ -587,6 +587,56 @@ def downloadEcEnzyme(ecNumberID):
     URLError
         If connection to KEGG fails.
     """
-    return REST.kegg_get('ec:' + ecNumberID, timeout=settings.downloadTimeoutSocket).read()
+    return REST.kegg_get('ec:' + ecNumberID, timeout=settings.downloadTimeout).read()
+
+
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+def downloadSubstanceChunk(substanceIDs: '[C00084, G00001,...]') -> str:
+    """
+    Download several substance description files from KEGG, compound or glycan, in a single request.
+    
+    Parameters
+    ----------
+    substanceIDs : Iterable[str]
+        The ID strings of the substances to download, e.g. '[C00084, G00001,...]'. At most 10, a hard limit imposed by KEGG server.
+    
+    Returns
+    -------
+    str
+        Substances in KEGG format, delimited by a line of '///'. You will have to split them! Substances not existing in KEGG are silently missing.
+    
+    Raises
+    ------
+    HTTPError
+        If none of the substances exist.
+    URLError
+        If connection to KEGG fails.
+    """
+    return REST.kegg_get('+'.join(substanceIDs), timeout=settings.downloadTimeout).read()
+
+
+@retry(wait_exponential_multiplier=settings.retryDownloadBackoffFactor, wait_exponential_max=settings.retryDownloadBackoffMax, wait_jitter_max=settings.retryDownloadBackoffJitter, stop_max_delay=settings.retryDownloadMax, retry_on_exception=is_not_404) # do not retry on HTTP error 404, raise immediately instead
+def downloadEcEnzymeChunk(ecNumberIDs: '[4.1.2.48, 1.1.1.1,...]') -> str:
+    """
+    Download several enzyme description files from KEGG, defined by their EC numbers, in a single request.
+    
+    Parameters
+    ----------
+    ecNumberIDs : Iterable[str]
+        The EC number strings of the enzymes to download, e.g. '[4.1.2.48, 1.1.1.1,...]'. At most 10, a hard limit imposed by KEGG server.
+    
+    Returns
+    -------
+    str
+        EcEnzymes in KEGG format, delimited by a line of '///'. You will have to split them! EcEnzymes not existing in KEGG are silently missing.
+    
+    Raises
+    ------
+    HTTPError
+        If none of the enzymes exist.
+    URLError
+        If connection to KEGG fails.
+    """
+    return REST.kegg_get('+'.join('ec:' + ecNumberID for ecNumberID in ecNumberIDs), timeout=settings.downloadTimeout).read()
 
     
\ No newline at end of file
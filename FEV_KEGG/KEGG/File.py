@@ -56,6 +56,41 @@ def writeToFile(content: 'will be encoded in UTF-8', fileName: 'will be overwrit
         with open(path, 'w', encoding = 'utf_8', errors = 'strict') as file:
             file.write(content)
 
+def writeToFileIncrementally(contentParts: 'each will be encoded in UTF-8', fileName: 'will be overwritten, if already present', atomic = True):
+    """
+    Writes `contentParts` to a text file, one part after the other.
+    
+    Unlike :func:`writeToFile`, the whole content never has to be held in memory at once, if `contentParts` is a generator.
+    `fileName` is relative to your cache folder! See :attr:`FEV_KEGG.settings.cachePath`.
+    File will be overwritten completely, if already present.
+    
+    Parameters
+    ----------
+    contentParts : Iterable[str]
+        Consecutive parts of the content of the file. Will be encoded into UTF-8.
+    fileName : str
+        Path and name of the file, in a format your OS understands. Something like 'subfolder/another_folder/myFile.txt' should most likely work.
+    atomic : bool, optional
+        If *True*, write file atomically.
+    
+    Raises
+    ------
+    ValueError
+        Encoding into UTF-8 failed.
+    OSError
+        File could not be opened.
+    """
+    createPath(fileName)
+    path = os.path.join(cachePath, fileName)
+    if atomic:
+        with atomic_write(path, text = True) as file:
+            for contentPart in contentParts:
+                file.write(contentPart)
+    else:
+        with open(path, 'w', encoding = 'utf_8', errors = 'strict') as file:
+            for contentPart in contentParts:
+                file.write(contentPart)
+
 def writeToFileBytes(data, fileName: 'will be overwritten, if already present', atomic = True):
     """
     Writes `content` to a binary file.
@@ -102,12 +102,8 @@ class Organism(object):
 			organisms = []
 			
 			# filter quirky organisms, without any pathway
-			for nonExisting in quirks.NON_EXISTING_ORGANISMS:
-				while True:
-					try:
-						existingOrganisms.remove(nonExisting)
-					except ValueError:
-						break
+			nonExistingOrganisms = quirks.NON_EXISTING_ORGANISMS
+			existingOrganisms = [abbreviation for abbreviation in existingOrganisms if abbreviation not in nonExistingOrganisms]
 			
 			for abbreviation in existingOrganisms:
 				organism = cls(abbreviation, skipExistsCheck = True)
@@ -353,7 +349,7 @@ class Organism(object):
 		
 		See Also
 		--------
-		FEV_KEGG.quirks.METABOLIC_PATHWAYS : List of names for all pathways belonging to metabolism.
+		FEV_KEGG.quirks.METABOLIC_PATHWAYS : Set of names for all pathways belonging to metabolism.
 		"""
 		newSet = set()
 		for pathwayString in pathwayDescriptions:
@@ -236,11 +236,12 @@ class Matching(JSONpickable):
         
         self.timestamp = timestamp
         
+        matches = list(matches)
+        eValues = SequenceComparison.getExpectationValues([match.bitScore for match in matches], queryLength, [match.length for match in matches], databaseSize)
+        
         transientMatches = []
         
-        for match in matches:
-            
-            eValue = SequenceComparison.getExpectationValue(match.bitScore, queryLength, match.length, databaseSize)
+        for match, eValue in zip(matches, eValues):
             transientMatches.append( TransientMatch.fromMatch(match, eValue) )
         
         self.matches = transientMatches
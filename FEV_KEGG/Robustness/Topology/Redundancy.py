@@ -16,12 +16,15 @@ This means the alternative paths have to include both, the orginal substrate and
 from FEV_KEGG.Graph.Models import DirectedMultiGraph, Path, MarkedPath
 import FEV_KEGG.KEGG.Organism as Organism
 from FEV_KEGG.Evolution.Clade import Clade, CladePair
-from typing import Dict, Set, Tuple
+from typing import Dict, FrozenSet, List, Set, Tuple
 from FEV_KEGG.Graph.Elements import Element
 from enum import Enum
+from collections import defaultdict
+from operator import attrgetter
 from FEV_KEGG import settings
+from FEV_KEGG.Util import Parallelism
 import tqdm
-from FEV_KEGG.Util.Util import updateDictUpdatingValue
+from FEV_KEGG.Util.Util import inverseDictOfSets
 
 
 class Robustness():
@@ -188,15 +191,15 @@ class Robustness():
         # basic metrics
         ## sums
         ### keys
-        self.sumKeys = 0
-        self.sumBreakingKeys = 0
-        self.sumPartiallyRedundantKeys = 0
-        self.sumRedundantKeys = 0
+        self.sumKeys = len(self.redundantPathsForEdgeForKey)
+        #derived self.sumBreakingKeys
+        #derived self.sumPartiallyRedundantKeys
+        #derived self.sumRedundantKeys
         
         ### edges
-        self.sumEdges = 0
-        self.sumBreakingEdges = 0
-        self.sumRedundantEdges = 0
+        self.sumEdges = sum(map(len, self.redundantPathsForEdgeForKey.values()))
+        #derived self.sumBreakingEdges
+        #derived self.sumRedundantEdges
         
         
         ## counts
@@ -239,45 +242,47 @@ class Robustness():
         
         for key, edgesDict in iterator:
             
-            self.sumKeys += 1
+            nEdges = len(edgesDict)
             
             tmpRedundantEdges = 0
             tmpRedundantPaths = 0
             
-            for edge, paths in edgesDict.items():
-                
-                source, target = edge
-                self.sumEdges += 1
+            for (source, target), paths in edgesDict.items():
                 
                 pathsLength = len(paths)
                 
                 if pathsLength > 0: # edge has redundant paths
-                    self.sumRedundantEdges += 1
                     self.redundantEdgePathCounts[(source, target, key)] = pathsLength
                     tmpRedundantEdges += 1
                     
                 else: # edge has no redundant paths
-                    self.sumBreakingEdges += 1
                     self.nonRedundantEdges.add((source, target, key))
                 
                 tmpRedundantPaths += pathsLength
                 self.paths.update(paths)
             
-            if tmpRedundantEdges == len(edgesDict.keys()): # all edges have redundant paths
-                self.sumRedundantKeys += 1
+            if tmpRedundantEdges == nEdges: # all edges have redundant paths
                 self.redundantKeyPathCounts[key] = tmpRedundantPaths
             
             elif tmpRedundantEdges > 0: # only part of the edges have redundant paths
-                self.sumPartiallyRedundantKeys += 1
                 self.partiallyRedundantKeyPathCounts[key] = tmpRedundantPaths
             
             else: # none of the edges have redundant paths
-                self.sumBreakingKeys += 1
                 self.nonRedundantKeys.add(key)
                 
         
         # derived metrics
         ## sums
+        ### keys, each key is listed exactly once
+        self.sumBreakingKeys = len(self.nonRedundantKeys)
+        self.sumPartiallyRedundantKeys = len(self.partiallyRedundantKeyPathCounts)
+        self.sumRedundantKeys = len(self.redundantKeyPathCounts)
+        
+        ### edges, each edge is listed exactly once
+        self.sumBreakingEdges = len(self.nonRedundantEdges)
+        self.sumRedundantEdges = len(self.redundantEdgePathCounts)
+        
+        ### paths
         self.sumPaths = len(self.paths) # sum of all redundant paths. Counting each path only once, because there are likely duplicates.
         
         ## ratios
@@ -328,9 +333,72 @@ class Robustness():
         return pathsDict
 
     
+def _markPaths(paths: Set[Path], specialKeys: Set[Element], bitForSpecialKey: Dict[Element, int], markedPathCache: Dict[int, Tuple[Path, MarkedPath, int]]) -> List[Tuple[MarkedPath, int]]:
+    """
+    Materialise the marked paths for a whole set of paths at once.
+    
+    Parameters
+    ----------
+    paths : Set[Path]
+        Paths to be marked.
+    specialKeys : Set[Element]
+        Special keys to mark on each path.
+    bitForSpecialKey : Dict[Element, int]
+        Each special key pointing to its own bit, see :func:`_bitsToKeys`.
+    markedPathCache : Dict[int, Tuple[Path, MarkedPath, int]]
+        Marked paths already built, and the bitmask of their special keys, keyed by the id of their unmarked path. Will be extended by the paths marked here.
+    
+    Returns
+    -------
+    List[Tuple[MarkedPath, int]]
+        Marked paths of `paths`, only those with at least one special key on them, together with the bitmask of their special keys.
+    """
+    markedPaths = []
+    for path in paths:
+        cacheEntry = markedPathCache.get(id(path))
+        if cacheEntry is None: # path not yet marked
+            markedPath = MarkedPath(path, specialKeys)
+            specialKeyBits = 0
+            for specialKey in markedPath.specialKeys:
+                specialKeyBits |= bitForSpecialKey[specialKey]
+            markedPathCache[id(path)] = (path, markedPath, specialKeyBits) # keep a reference to path, so its id can not be re-used
+        else:
+            _, markedPath, specialKeyBits = cacheEntry
+        
+        if specialKeyBits != 0: # path has special keys
+            markedPaths.append((markedPath, specialKeyBits))
+    
+    return markedPaths
+
+def _bitsToKeys(specialKeyBits: int, keyForBit: Dict[int, Element]) -> Set[Element]:
+    """
+    Convert a bitmask of special keys back into a set.
+    
+    Accumulating special keys via bitwise OR is much cheaper than repeatedly updating a set. Only the set bits are visited here.
+    
+    Parameters
+    ----------
+    specialKeyBits : int
+        Bitmask of special keys.
+    keyForBit : Dict[int, Element]
+        Each single bit pointing to its special key, the inverse of `bitForSpecialKey` in :func:`_markPaths`.
+    
+    Returns
+    -------
+    Set[Element]
+    """
+    keys = set()
+    while specialKeyBits:
+        lowestBit = specialKeyBits & -specialKeyBits
+        keys.add(keyForBit[lowestBit])
+        specialKeyBits ^= lowestBit
+    return keys
+
+
+
 class RobustnessContribution():
     
-    def __init__(self, robustness: Robustness, specialKeys: Set[Element]):
+    def __init__(self, robustness: Robustness, specialKeys: Set[Element], collectPaths = True):
         """
         Contribution to robustness accountable to edges with `specialKeys`.
         
@@ -341,6 +409,8 @@ class RobustnessContribution():
         robustness : Robustness
         specialKeys : Set[Element]
             Set of key elements viewed to be somehow special. One type of special could be 'neofunctionalised'.
+        collectPaths : bool, optional
+            If *False*, the marked paths are not collected per key, saving time and memory if only ratios and special keys are of interest. The attributes holding paths per key are then *None*.
         
         Attributes
         ----------
@@ -381,6 +451,12 @@ class RobustnessContribution():
             Partially redundant key element pointing to the set of marked redundant paths it can be replaced with, which contain a special key.
         """
         self.robustness = robustness
+        self.collectPaths = collectPaths
+        specialKeys = frozenset(specialKeys) # hashable and immutable, membership is tested for every key on every path
+        
+        # each special key gets its own bit, so accumulating them per key is a bitwise OR
+        bitForSpecialKey = {specialKey: 1 << index for index, specialKey in enumerate(specialKeys)}
+        keyForBit = {bit: specialKey for specialKey, bit in bitForSpecialKey.items()}
         
         # basic metrics
         ## sums
@@ -389,8 +465,8 @@ class RobustnessContribution():
         #self.sumSpecialKeysOnPaths = 0
         
         ### keys
-        self.sumRedundantKeysWithSpecialKeyOnPaths = 0
-        self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths = 0
+        #derived self.sumRedundantKeysWithSpecialKeyOnPaths
+        #derived self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths
         
         ### edges
         #self.sumEdgesWithSpecialKeysOnPaths = 0
@@ -441,8 +517,12 @@ class RobustnessContribution():
         self.partiallyRedundantKeySpecialKeysOnPaths = dict()
         
         ### key -> paths
-        self.redundantKeyPathsWithSpecialKey = dict()
-        self.partiallyRedundantKeyPathsWithSpecialKey = dict()
+        if collectPaths:
+            self.redundantKeyPathsWithSpecialKey = dict()
+            self.partiallyRedundantKeyPathsWithSpecialKey = dict()
+        else:
+            self.redundantKeyPathsWithSpecialKey = None
+            self.partiallyRedundantKeyPathsWithSpecialKey = None
 
 
         # calculation
@@ -453,46 +533,45 @@ class RobustnessContribution():
                 print( 'Calculating robust path contributions for ' + str(len(self.robustness.redundantPathsForEdgeForKey)) + ' edge keys...' )
             iterator = tqdm.tqdm(iterator, total = len(self.robustness.redundantPathsForEdgeForKey), unit = ' edge keys')
         
+        # the same path object can provide redundancy for many edges and keys, mark it only once
+        markedPathCache = dict() # Dict[int, Tuple[Path, MarkedPath, int]]
+        
         for key, edgesDict in iterator:
             
+            edgesLen = len(edgesDict)
+            
             hasKeySpecialKeyOnPath = False
             tmpRedundantEdges = 0
-            tmpSpecialKeysOnPaths = set()
-            tmpMarkedPaths = set()
+            tmpSpecialKeyBitsOnPaths = 0
+            tmpMarkedPaths = [] # marked paths are unique objects thanks to markedPathCache, hashing them is deferred until they are stored
             
-            for _, paths in edgesDict.items():
+            for paths in edgesDict.values(): # the edge itself is not needed here
                 
-                #source, target = edge               
                 pathsLength = len(paths)
                 
                 if pathsLength > 0: # edge has redundant paths
                     
                     tmpRedundantEdges += 1
                     
-                    for path in paths:
+                    for markedPath, specialKeyBits in _markPaths(paths, specialKeys, bitForSpecialKey, markedPathCache): # only paths with special keys
                         
-                        markedPath = MarkedPath(path, specialKeys)
-                        specialKeysOnPath = markedPath.specialKeys
-                        specialKeysOnPathLength = len(specialKeysOnPath)
-                        
-                        if specialKeysOnPathLength > 0: # path has special keys
-                            
-                            tmpSpecialKeysOnPaths.update(specialKeysOnPath)
-                            self.pathsWithSpecialKeys.add(markedPath)
-                            tmpMarkedPaths.add(markedPath)
-                            hasKeySpecialKeyOnPath = True
+                        tmpSpecialKeyBitsOnPaths |= specialKeyBits
+                        self.pathsWithSpecialKeys.add(markedPath)
+                        if collectPaths:
+                            tmpMarkedPaths.append(markedPath)
+                        hasKeySpecialKeyOnPath = True
             
             if hasKeySpecialKeyOnPath is True:
                 
-                if tmpRedundantEdges == len(edgesDict.keys()): # all edges have redundant paths
-                    self.sumRedundantKeysWithSpecialKeyOnPaths += 1
-                    self.redundantKeySpecialKeysOnPaths[key] = tmpSpecialKeysOnPaths
-                    self.redundantKeyPathsWithSpecialKey[key] = tmpMarkedPaths
+                if tmpRedundantEdges == edgesLen: # all edges have redundant paths
+                    self.redundantKeySpecialKeysOnPaths[key] = _bitsToKeys(tmpSpecialKeyBitsOnPaths, keyForBit)
+                    if collectPaths:
+                        self.redundantKeyPathsWithSpecialKey[key] = set(tmpMarkedPaths)
                 
                 elif tmpRedundantEdges > 0: # only part of the edges have redundant paths
-                    self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths += 1
-                    self.partiallyRedundantKeySpecialKeysOnPaths[key] = tmpSpecialKeysOnPaths
-                    self.partiallyRedundantKeyPathsWithSpecialKey[key] = tmpMarkedPaths
+                    self.partiallyRedundantKeySpecialKeysOnPaths[key] = _bitsToKeys(tmpSpecialKeyBitsOnPaths, keyForBit)
+                    if collectPaths:
+                        self.partiallyRedundantKeyPathsWithSpecialKey[key] = set(tmpMarkedPaths)
                 
                 else: # none of the edges have redundant paths
                     pass
@@ -501,33 +580,20 @@ class RobustnessContribution():
         
         # derived metrics
         ## sum
+        self.sumRedundantKeysWithSpecialKeyOnPaths = len(self.redundantKeySpecialKeysOnPaths) # each key is listed at most once
+        self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths = len(self.partiallyRedundantKeySpecialKeysOnPaths)
         self.sumPathsWithSpecialKeys = len(self.pathsWithSpecialKeys) # sum of all paths with at least one special key on it. Counting each path only once, because there are likely dupliactes.
         
         ## ratios
-        self.pathsWithSpecialKeyRatio = 0 if self.robustness.sumPaths == 0 else self.sumPathsWithSpecialKeys/self.robustness.sumPaths
-        self.redundantKeysWithSpecialKeyOnPathsRatio = 0 if self.robustness.sumRedundantKeys == 0 else self.sumRedundantKeysWithSpecialKeyOnPaths/self.robustness.sumRedundantKeys
-        self.partiallyRedundantKeysWithSpecialKeyOnPathsRatio = 0 if self.robustness.sumPartiallyRedundantKeys == 0 else self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths/self.robustness.sumPartiallyRedundantKeys
+        self.pathsWithSpecialKeyRatio = 0 if robustness.sumPaths == 0 else self.sumPathsWithSpecialKeys/robustness.sumPaths
+        self.redundantKeysWithSpecialKeyOnPathsRatio = 0 if robustness.sumRedundantKeys == 0 else self.sumRedundantKeysWithSpecialKeyOnPaths/robustness.sumRedundantKeys
+        self.partiallyRedundantKeysWithSpecialKeyOnPathsRatio = 0 if robustness.sumPartiallyRedundantKeys == 0 else self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths/robustness.sumPartiallyRedundantKeys
         
         ## assignments
         ### special key -> keys
-        self.specialKeyOnRedundantKeysPaths = dict()
-        self.specialKeyOnPartiallyRedundantKeysPaths = dict()
-        
-        for key, specialKeys in self.redundantKeySpecialKeysOnPaths.items():
-            for specialKey in specialKeys:
-                currentSet = self.specialKeyOnRedundantKeysPaths.get(specialKey)
-                if currentSet is None:
-                    currentSet = set()
-                    self.specialKeyOnRedundantKeysPaths[specialKey] = currentSet
-                currentSet.add(key)
-        
-        for key, specialKeys in self.partiallyRedundantKeySpecialKeysOnPaths.items():
-            for specialKey in specialKeys:
-                currentSet = self.specialKeyOnPartiallyRedundantKeysPaths.get(specialKey)
-                if currentSet is None:
-                    currentSet = set()
-                    self.specialKeyOnPartiallyRedundantKeysPaths[specialKey] = currentSet
-                currentSet.add(key)
+        # each dictionary is built in one go, instead of updating an empty one
+        self.specialKeyOnRedundantKeysPaths = inverseDictOfSets(self.redundantKeySpecialKeysOnPaths)
+        self.specialKeyOnPartiallyRedundantKeysPaths = inverseDictOfSets(self.partiallyRedundantKeySpecialKeysOnPaths)
         
  
         
@@ -691,26 +757,26 @@ class Flexibility():
         # basic metrics
         ## sums
         ### keys
-        self.sumKeys = 0 # sum of all keys. Each key can be represented by multiple edges with different or overlapping pairs of source+target.
+        self.sumKeys = len(self.redundantPathsTupleForEdgeForKey) # sum of all keys. Each key can be represented by multiple edges with different or overlapping pairs of source+target.
         
         #### both redundancies
-        self.sumNonRedundantKeys = 0 # sum of keys for which none of their edges are redundant.
-        self.sumPartiallyRedundantKeys = 0 # sum of keys for which only part of their edges are redundant. This counts all possible forms of non-redundancy, including non-source-redundancy where the edge has not other edge sharing the same source.        
-        self.sumRedundantKeys = 0 # sum of keys for which all their edges are redundant, for both source and target.
+        #derived self.sumNonRedundantKeys # sum of keys for which none of their edges are redundant.
+        #derived self.sumPartiallyRedundantKeys # sum of keys for which only part of their edges are redundant. This counts all possible forms of non-redundancy, including non-source-redundancy where the edge has not other edge sharing the same source.        
+        #derived self.sumRedundantKeys # sum of keys for which all their edges are redundant, for both source and target.
         
         #### only target-redundancy
-        self.sumNonTargetRedundantKeys = 0 # sum of keys for which none of their edges are target-redundant. In contrast to self.sumNonRedundantKeys, this ignores non-source-redundancy, counting only missing target-redundancy as non-redundancy.
-        self.sumPartiallyTargetRedundantKeys = 0 # sum of keys for which only part of their edges are target-redundant. In contrast to self.sumPartiallyRedundantKeys, this ignores non-source-redundancy, counting only missing target-redundancy as non-redundancy.
-        self.sumTargetRedundantKeys = 0 # sum of keys for which all their edges are target-redundant. In contrast to self.sumRedundantKeys, this ignores non-source-redundancy, counting only missing target-redundancy as non-redundancy.
+        #derived self.sumNonTargetRedundantKeys # sum of keys for which none of their edges are target-redundant. In contrast to self.sumNonRedundantKeys, this ignores non-source-redundancy, counting only missing target-redundancy as non-redundancy.
+        #derived self.sumPartiallyTargetRedundantKeys # sum of keys for which only part of their edges are target-redundant. In contrast to self.sumPartiallyRedundantKeys, this ignores non-source-redundancy, counting only missing target-redundancy as non-redundancy.
+        #derived self.sumTargetRedundantKeys # sum of keys for which all their edges are target-redundant. In contrast to self.sumRedundantKeys, this ignores non-source-redundancy, counting only missing target-redundancy as non-redundancy.
         
         #### only source-redundancy
-        self.sumNonSourceRedundantKeys = 0 # sum of keys for which none of their edges are source-redundant. In contrast to self.sumNonRedundantKeys, this ignores non-target-redundancy, counting only missing source-redundancy as non-redundancy.
-        self.sumPartiallySourceRedundantKeys = 0 # sum of keys for which only part of their edges are source-redundant. In contrast to self.sumPartiallyRedundantKeys, this ignores non-target-redundancy, counting only missing source-redundancy as non-redundancy.
-        self.sumSourceRedundantKeys = 0 # sum of keys for which all their edges are source-redundant. In contrast to self.sumRedundantKeys, this ignores non-target-redundancy, counting only missing source-redundancy as non-redundancy.
+        #derived self.sumNonSourceRedundantKeys # sum of keys for which none of their edges are source-redundant. In contrast to self.sumNonRedundantKeys, this ignores non-target-redundancy, counting only missing source-redundancy as non-redundancy.
+        #derived self.sumPartiallySourceRedundantKeys # sum of keys for which only part of their edges are source-redundant. In contrast to self.sumPartiallyRedundantKeys, this ignores non-target-redundancy, counting only missing source-redundancy as non-redundancy.
+        #derived self.sumSourceRedundantKeys # sum of keys for which all their edges are source-redundant. In contrast to self.sumRedundantKeys, this ignores non-target-redundancy, counting only missing source-redundancy as non-redundancy.
         
         
         ### edges
-        self.sumEdges = 0 # sum of all edges
+        self.sumEdges = sum(map(len, self.redundantPathsTupleForEdgeForKey.values())) # sum of all edges
         
         #### both redundancies
         #self.sumNonRedundantEdges = 0 # sum of edges with no redundant edge sharing neither source nor target (not necessarily in the same edge).
@@ -791,10 +857,26 @@ class Flexibility():
             if settings.verbosity >= 2:
                 print( 'Gathering flexible path statistics for ' + str(len(self.redundantPathsTupleForEdgeForKey)) + ' edge keys...' )
             iterator = tqdm.tqdm(iterator, total = len(self.redundantPathsTupleForEdgeForKey), unit = ' edge keys')
+        
+        # bind frequently used methods to local names, saves an attribute lookup per call inside the loops
+        sourcePathsUpdate = self.sourcePaths.update
+        targetPathsUpdate = self.targetPaths.update
+        
+        redundantKeysAdd = self.redundantKeys.add
+        partiallyRedundantKeysAdd = self.partiallyRedundantKeys.add
+        nonRedundantKeysAdd = self.nonRedundantKeys.add
+        
+        targetRedundantKeysAdd = self.targetRedundantKeys.add
+        partiallyTargetRedundantKeysAdd = self.partiallyTargetRedundantKeys.add
+        nonTargetRedundantKeysAdd = self.nonTargetRedundantKeys.add
+        
+        sourceRedundantKeysAdd = self.sourceRedundantKeys.add
+        partiallySourceRedundantKeysAdd = self.partiallySourceRedundantKeys.add
+        nonSourceRedundantKeysAdd = self.nonSourceRedundantKeys.add
             
         for key, edgesDict in iterator: # for all keys
             
-            self.sumKeys += 1
+            nEdges = len(edgesDict)
             
             tmpRedundantEdges = 0
             tmpTargetRedundantEdges = 0            
@@ -804,46 +886,21 @@ class Flexibility():
             #tmpTargetRedundantPaths = 0
             #tmpSourceRedundantPaths = 0
             
-            for _, pathsTuple in edgesDict.items(): # for all edges
+            for sourcePaths, targetPaths in edgesDict.values(): # for all edges
                 
                 #source, target = edge
-                self.sumEdges += 1
-                
-                isSourceRedundant = False
-                isTargetRedundant = False
                 
-                for index, paths in enumerate(pathsTuple): # for source/target
-                    
-                    pathsLength = len(paths)
-                    
-#                     if index == 0: # source-redundancy
-#                         #tmpSumSourceWildcardEdges += 1
-#                         pass
-#                         
-#                     elif index == 1: # target-redundancy
-#                         #tmpSumTargetWildcardEdges += 1
-#                         pass
-#                     
-#                     else:
-#                         raise RuntimeError
+                # source-redundancy
+                isSourceRedundant = len(sourcePaths) > 0 # wildcardEdge has redundant paths
+                if isSourceRedundant:
+                    #tmpSourceRedundantPaths += len(sourcePaths)
+                    sourcePathsUpdate(sourcePaths)
                 
-                    if pathsLength > 0: # wildcardEdge has redundant paths
-                        
-                        if index == 0: # source-redundancy
-                            #tmpSourceRedundantPaths += pathsLength
-                            isSourceRedundant = True
-                            self.sourcePaths.update(paths)
-                            
-                        elif index == 1: # target-redundancy
-                            #tmpTargetRedundantPaths += pathsLength
-                            isTargetRedundant = True
-                            self.targetPaths.update(paths)
-                        
-                        else:
-                            raise RuntimeError
-                    
-                    else: # wildcardEdge has no redundant paths
-                        pass
+                # target-redundancy
+                isTargetRedundant = len(targetPaths) > 0 # wildcardEdge has redundant paths
+                if isTargetRedundant:
+                    #tmpTargetRedundantPaths += len(targetPaths)
+                    targetPathsUpdate(targetPaths)
                 
                 # both source and target redundant? -> edge redundant
                 if isSourceRedundant and isTargetRedundant:
@@ -858,48 +915,53 @@ class Flexibility():
                     tmpSourceRedundantEdges += 1
             
             # both redundancies
-            if tmpRedundantEdges == len(edgesDict.keys()): # all edges have redundant paths
-                self.sumRedundantKeys += 1
-                self.redundantKeys.add(key)
+            if tmpRedundantEdges == nEdges: # all edges have redundant paths
+                redundantKeysAdd(key)
             
             elif tmpRedundantEdges > 0: # only part of the edges have redundant paths
-                self.sumPartiallyRedundantKeys += 1
-                self.partiallyRedundantKeys.add(key)
+                partiallyRedundantKeysAdd(key)
             
             else: # none of the wildcard edges have redundant paths
-                self.sumNonRedundantKeys += 1
-                self.nonRedundantKeys.add(key)
+                nonRedundantKeysAdd(key)
             
             # target-redundancy
-            if tmpTargetRedundantEdges == len(edgesDict.keys()): # all edges have target-redundant paths
-                self.sumTargetRedundantKeys += 1
-                self.targetRedundantKeys.add(key)
+            if tmpTargetRedundantEdges == nEdges: # all edges have target-redundant paths
+                targetRedundantKeysAdd(key)
             
             elif tmpTargetRedundantEdges > 0: # only part of the edges have target-redundant paths
-                self.sumPartiallyTargetRedundantKeys += 1
-                self.partiallyTargetRedundantKeys.add(key)
+                partiallyTargetRedundantKeysAdd(key)
             
             else: # none of the edges have target-redundant paths
-                self.sumNonTargetRedundantKeys += 1
-                self.nonTargetRedundantKeys.add(key)
+                nonTargetRedundantKeysAdd(key)
             
             # source-redundancy
-            if tmpSourceRedundantEdges == len(edgesDict.keys()): # all edges have source-redundant paths
-                self.sumSourceRedundantKeys += 1
-                self.sourceRedundantKeys.add(key)
+            if tmpSourceRedundantEdges == nEdges: # all edges have source-redundant paths
+                sourceRedundantKeysAdd(key)
             
             elif tmpSourceRedundantEdges > 0: # only part of the edges have source-redundant paths
-                self.sumPartiallySourceRedundantKeys += 1
-                self.partiallySourceRedundantKeys.add(key)
+                partiallySourceRedundantKeysAdd(key)
             
             else: # none of the edges have source-redundant paths
-                self.sumNonSourceRedundantKeys += 1
-                self.nonSourceRedundantKeys.add(key)
+                nonSourceRedundantKeysAdd(key)
 
 
         
         # derived metrics
         ## sums
+        ### keys, each key is listed exactly once per type of redundancy
+        self.sumNonRedundantKeys = len(self.nonRedundantKeys)
+        self.sumPartiallyRedundantKeys = len(self.partiallyRedundantKeys)
+        self.sumRedundantKeys = len(self.redundantKeys)
+        
+        self.sumNonTargetRedundantKeys = len(self.nonTargetRedundantKeys)
+        self.sumPartiallyTargetRedundantKeys = len(self.partiallyTargetRedundantKeys)
+        self.sumTargetRedundantKeys = len(self.targetRedundantKeys)
+        
+        self.sumNonSourceRedundantKeys = len(self.nonSourceRedundantKeys)
+        self.sumPartiallySourceRedundantKeys = len(self.partiallySourceRedundantKeys)
+        self.sumSourceRedundantKeys = len(self.sourceRedundantKeys)
+        
+        ### paths
         #property self.sumPaths = len(self.paths) # sum of all redundant paths for both source and target. Counting each path only once, because there are likely duplicates.
         
         ## ratios
@@ -973,15 +1035,13 @@ class Flexibility():
                 pathsDict[key] = allPaths
                 
             edgesDict = self.redundantPathsTupleForEdgeForKey[key]
-            for pathsTuple in edgesDict.values():
-                for index, paths in enumerate(pathsTuple): # for source/target
-                    if len(paths) > 0:
-                        
-                        if index == 0 and targetOrSource <= 0: # source-redundancy
-                            allPaths.update(paths)
-                            
-                        elif index == 1 and targetOrSource >= 0: # target-redundancy
-                            allPaths.update(paths)
+            for sourcePaths, targetPaths in edgesDict.values():
+                
+                if targetOrSource <= 0: # source-redundancy
+                    allPaths.update(sourcePaths)
+                
+                if targetOrSource >= 0: # target-redundancy
+                    allPaths.update(targetPaths)
         
         return pathsDict
         
@@ -989,7 +1049,7 @@ class Flexibility():
         
 class FlexibilityContribution():
     
-    def __init__(self, flexibility: Flexibility, specialKeys: Dict[str, Set[Element]]):
+    def __init__(self, flexibility: Flexibility, specialKeys: Dict[str, Set[Element]], collectPaths = True):
         """
         Contribution to flexibility accountable to edges with `specialKeys`.
         
@@ -1000,6 +1060,8 @@ class FlexibilityContribution():
         flexibility : Flexibility
         specialKeys : Set[Element]
             Set of key elements viewed to be somehow special. One type of special could be 'neofunctionalised'.
+        collectPaths : bool, optional
+            If *False*, the marked paths are not collected per key, saving time and memory if only ratios and special keys are of interest. The attributes holding paths per key are then *None*.
         
         Attributes
         ----------
@@ -1086,6 +1148,12 @@ class FlexibilityContribution():
             Ratio of the sum of partially source-redundant keys with a special key on its paths to the sum of all partially source-redundant keys.
         """
         self.flexibility = flexibility
+        self.collectPaths = collectPaths
+        specialKeys = frozenset(specialKeys) # hashable and immutable, membership is tested for every key on every path
+        
+        # each special key gets its own bit, so accumulating them per key is a bitwise OR
+        bitForSpecialKey = {specialKey: 1 << index for index, specialKey in enumerate(specialKeys)}
+        keyForBit = {bit: specialKey for specialKey, bit in bitForSpecialKey.items()}
         
         # basic metrics
         ## sums
@@ -1166,17 +1234,25 @@ class FlexibilityContribution():
         self.partiallySourceRedundantKeySpecialKeysOnPaths = dict()
         
         ### key -> paths
-        #### both redundancies
-        self.redundantKeyPathsWithSpecialKey = dict()
-        self.partiallyRedundantKeyPathsWithSpecialKey = dict()
-        
-        #### only target-redundancy
-        self.targetRedundantKeyPathsWithSpecialKey = dict()
-        self.partiallyTargetRedundantKeyPathsWithSpecialKey = dict()
-        
-        #### only source-redundancy
-        self.sourceRedundantKeyPathsWithSpecialKey = dict()
-        self.partiallySourceRedundantKeyPathsWithSpecialKey = dict()
+        if collectPaths:
+            #### both redundancies
+            self.redundantKeyPathsWithSpecialKey = dict()
+            self.partiallyRedundantKeyPathsWithSpecialKey = dict()
+            
+            #### only target-redundancy
+            self.targetRedundantKeyPathsWithSpecialKey = dict()
+            self.partiallyTargetRedundantKeyPathsWithSpecialKey = dict()
+            
+            #### only source-redundancy
+            self.sourceRedundantKeyPathsWithSpecialKey = dict()
+            self.partiallySourceRedundantKeyPathsWithSpecialKey = dict()
+        else:
+            self.redundantKeyPathsWithSpecialKey = None
+            self.partiallyRedundantKeyPathsWithSpecialKey = None
+            self.targetRedundantKeyPathsWithSpecialKey = None
+            self.partiallyTargetRedundantKeyPathsWithSpecialKey = None
+            self.sourceRedundantKeyPathsWithSpecialKey = None
+            self.partiallySourceRedundantKeyPathsWithSpecialKey = None
         
         
 
@@ -1189,68 +1265,71 @@ class FlexibilityContribution():
                 print( 'Calculating flexible path contributions for ' + str(len(self.flexibility.redundantPathsTupleForEdgeForKey)) + ' edge keys...' )
             iterator = tqdm.tqdm(iterator, total = len(self.flexibility.redundantPathsTupleForEdgeForKey), unit = ' edge keys')
         
+        # where to put the results of each type of redundancy: (full special keys, full paths, partial special keys, partial paths)
+        tallyTargets = ((self.redundantKeySpecialKeysOnPaths, self.redundantKeyPathsWithSpecialKey, self.partiallyRedundantKeySpecialKeysOnPaths, self.partiallyRedundantKeyPathsWithSpecialKey), # both redundancies
+                        (self.targetRedundantKeySpecialKeysOnPaths, self.targetRedundantKeyPathsWithSpecialKey, self.partiallyTargetRedundantKeySpecialKeysOnPaths, self.partiallyTargetRedundantKeyPathsWithSpecialKey), # target-redundancy
+                        (self.sourceRedundantKeySpecialKeysOnPaths, self.sourceRedundantKeyPathsWithSpecialKey, self.partiallySourceRedundantKeySpecialKeysOnPaths, self.partiallySourceRedundantKeyPathsWithSpecialKey)) # source-redundancy
+        
+        # the same path object can provide redundancy for many edges and keys, mark it only once
+        markedPathCache = dict() # Dict[int, Tuple[Path, MarkedPath, int]]
+        
         for key, edgesDict in iterator:
             
+            edgesLen = len(edgesDict)
+            
             hasKeySpecialKeyOnPath = False
             tmpRedundantEdges = 0
             tmpTargetRedundantEdges = 0
             tmpSourceRedundantEdges = 0
             
-            tmpSpecialKeysOnPaths = set()
-            tmpSpecialKeysOnTargetPaths = set()
-            tmpSpecialKeysOnSourcePaths = set()
+            tmpSpecialKeyBitsOnPaths = 0
+            tmpSpecialKeyBitsOnTargetPaths = 0
+            tmpSpecialKeyBitsOnSourcePaths = 0
             
-            tmpMarkedPaths = set()
-            tmpMarkedTargetPaths = set()
-            tmpMarkedSourcePaths = set()
+            # marked paths are unique objects thanks to markedPathCache, hashing them is deferred until they are stored
+            tmpMarkedTargetPaths = []
+            tmpMarkedSourcePaths = []
             
-            for _, pathsTuple in edgesDict.items():
+            # edges sharing a source/target share the very same set of paths, see lookaside buffer in Flexibility. Marking them again would not add anything.
+            ingestedSourcePathSets = set()
+            ingestedTargetPathSets = set()
+            
+            for sourcePaths, targetPaths in edgesDict.values():
                 
-                isSourceRedundant = False
-                isTargetRedundant = False
+                isSourceRedundant = len(sourcePaths) > 0
+                isTargetRedundant = len(targetPaths) > 0
                 
-                for index, paths in enumerate(pathsTuple): # for source/target
-                    
-                    pathsLength = len(paths)
+                # source-redundancy
+                if isSourceRedundant and id(sourcePaths) not in ingestedSourcePathSets: # wildcardEdge has redundant paths, not yet marked for this key
+                    ingestedSourcePathSets.add(id(sourcePaths))
                     
-                    if pathsLength > 0: # wildcardEdge has redundant paths
+                    for markedPath, specialKeyBits in _markPaths(sourcePaths, specialKeys, bitForSpecialKey, markedPathCache): # only paths with special keys
                         
-                        if index == 0: # source-redundancy
-                            isSourceRedundant = True
-                            
-                        elif index == 1: # target-redundancy
-                            isTargetRedundant = True
+                        tmpSpecialKeyBitsOnPaths |= specialKeyBits
+                        self.pathsWithSpecialKeys.add(markedPath)
                         
-                        else:
-                            raise RuntimeError
+                        self.sourcePathsWithSpecialKeys.add(markedPath)
+                        tmpSpecialKeyBitsOnSourcePaths |= specialKeyBits
+                        if collectPaths:
+                            tmpMarkedSourcePaths.append(markedPath)
                         
-                        for path in paths:
-                            
-                            markedPath = MarkedPath(path, specialKeys)
-                            specialKeysOnPath = markedPath.specialKeys
-                            specialKeysOnPathLength = len(specialKeysOnPath)
-                            
-                            if specialKeysOnPathLength > 0: # path has special keys
-                                
-                                tmpSpecialKeysOnPaths.update(specialKeysOnPath)
-                                self.pathsWithSpecialKeys.add(markedPath)
-                                
-                                if index == 0: # source-redundancy
-                                    self.sourcePathsWithSpecialKeys.add(markedPath)
-                                    tmpSpecialKeysOnSourcePaths.update(specialKeysOnPath)
-                                    tmpMarkedSourcePaths.add(markedPath)                                    
-                                    
-                                elif index == 1: # target-redundancy
-                                    self.targetPathsWithSpecialKeys.add(markedPath)
-                                    tmpSpecialKeysOnTargetPaths.update(specialKeysOnPath)
-                                    tmpMarkedTargetPaths.add(markedPath)
-                                
-                                tmpMarkedPaths.add(markedPath)
-                                
-                                hasKeySpecialKeyOnPath = True
+                        hasKeySpecialKeyOnPath = True
+                
+                # target-redundancy
+                if isTargetRedundant and id(targetPaths) not in ingestedTargetPathSets: # wildcardEdge has redundant paths, not yet marked for this key
+                    ingestedTargetPathSets.add(id(targetPaths))
                     
-                    else: # wildcardEdge has no redundant paths
-                        pass
+                    for markedPath, specialKeyBits in _markPaths(targetPaths, specialKeys, bitForSpecialKey, markedPathCache): # only paths with special keys
+                        
+                        tmpSpecialKeyBitsOnPaths |= specialKeyBits
+                        self.pathsWithSpecialKeys.add(markedPath)
+                        
+                        self.targetPathsWithSpecialKeys.add(markedPath)
+                        tmpSpecialKeyBitsOnTargetPaths |= specialKeyBits
+                        if collectPaths:
+                            tmpMarkedTargetPaths.append(markedPath)
+                        
+                        hasKeySpecialKeyOnPath = True
                                 
                 # both source and target redundant? -> edge redundant
                 if isSourceRedundant and isTargetRedundant:
@@ -1266,47 +1345,31 @@ class FlexibilityContribution():
             
             if hasKeySpecialKeyOnPath is True:
                 
-                # both redundancies
-                if tmpRedundantEdges == len(edgesDict.keys()): # all edges have redundant paths
-                    self.sumRedundantKeysWithSpecialKeyOnPaths += 1
-                    self.redundantKeySpecialKeysOnPaths[key] = tmpSpecialKeysOnPaths
-                    self.redundantKeyPathsWithSpecialKey[key] = tmpMarkedPaths
-                
-                elif tmpRedundantEdges > 0: # only part of the edges have redundant paths
-                    self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths += 1
-                    self.partiallyRedundantKeySpecialKeysOnPaths[key] = tmpSpecialKeysOnPaths
-                    self.partiallyRedundantKeyPathsWithSpecialKey[key] = tmpMarkedPaths
-                
-                else: # none of the edges have redundant paths
-                    pass
-                
-                # target-redundancy
-                if tmpTargetRedundantEdges == len(edgesDict.keys()): # all edges have target-redundant paths
-                    self.sumTargetRedundantKeysWithSpecialKeyOnPaths += 1
-                    self.targetRedundantKeySpecialKeysOnPaths[key] = tmpSpecialKeysOnTargetPaths
-                    self.targetRedundantKeyPathsWithSpecialKey[key] = tmpMarkedTargetPaths
-                
-                elif tmpTargetRedundantEdges > 0: # only part of the edges have target-redundant paths
-                    self.sumPartiallyTargetRedundantKeysWithSpecialKeyOnPaths += 1
-                    self.partiallyTargetRedundantKeySpecialKeysOnPaths[key] = tmpSpecialKeysOnTargetPaths
-                    self.partiallyTargetRedundantKeyPathsWithSpecialKey[key] = tmpMarkedTargetPaths
-                
-                else: # none of the edges have target-redundant paths
-                    pass
-                
-                # source-redundancy
-                if tmpSourceRedundantEdges == len(edgesDict.keys()): # all edges have source-redundant paths
-                    self.sumSourceRedundantKeysWithSpecialKeyOnPaths += 1
-                    self.sourceRedundantKeySpecialKeysOnPaths[key] = tmpSpecialKeysOnSourcePaths
-                    self.sourceRedundantKeyPathsWithSpecialKey[key] = tmpMarkedSourcePaths
+                tallies = ((tmpRedundantEdges, tmpSpecialKeyBitsOnPaths, tmpMarkedSourcePaths + tmpMarkedTargetPaths),
+                           (tmpTargetRedundantEdges, tmpSpecialKeyBitsOnTargetPaths, tmpMarkedTargetPaths),
+                           (tmpSourceRedundantEdges, tmpSpecialKeyBitsOnSourcePaths, tmpMarkedSourcePaths))
                 
-                elif tmpSourceRedundantEdges > 0: # only part of the edges have source-redundant paths
-                    self.sumPartiallySourceRedundantKeysWithSpecialKeyOnPaths += 1
-                    self.partiallySourceRedundantKeySpecialKeysOnPaths[key] = tmpSpecialKeysOnSourcePaths
-                    self.partiallySourceRedundantKeyPathsWithSpecialKey[key] = tmpMarkedSourcePaths
-                
-                else: # none of the edges have source-redundant paths
-                    pass
+                for (redundantEdges, specialKeyBitsOnPaths, markedPaths), (fullSpecialKeys, fullPaths, partialSpecialKeys, partialPaths) in zip(tallies, tallyTargets):
+                    
+                    if redundantEdges == edgesLen: # all edges have redundant paths
+                        fullSpecialKeys[key] = _bitsToKeys(specialKeyBitsOnPaths, keyForBit)
+                        if collectPaths:
+                            fullPaths[key] = set(markedPaths)
+                    
+                    elif redundantEdges > 0: # only part of the edges have redundant paths
+                        partialSpecialKeys[key] = _bitsToKeys(specialKeyBitsOnPaths, keyForBit)
+                        if collectPaths:
+                            partialPaths[key] = set(markedPaths)
+                    
+                    # else: none of the edges have redundant paths
+        
+        # each key is counted at most once per type of redundancy
+        self.sumRedundantKeysWithSpecialKeyOnPaths = len(self.redundantKeySpecialKeysOnPaths)
+        self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths = len(self.partiallyRedundantKeySpecialKeysOnPaths)
+        self.sumTargetRedundantKeysWithSpecialKeyOnPaths = len(self.targetRedundantKeySpecialKeysOnPaths)
+        self.sumPartiallyTargetRedundantKeysWithSpecialKeyOnPaths = len(self.partiallyTargetRedundantKeySpecialKeysOnPaths)
+        self.sumSourceRedundantKeysWithSpecialKeyOnPaths = len(self.sourceRedundantKeySpecialKeysOnPaths)
+        self.sumPartiallySourceRedundantKeysWithSpecialKeyOnPaths = len(self.partiallySourceRedundantKeySpecialKeysOnPaths)
         
 
         # derived metrics
@@ -1314,49 +1377,35 @@ class FlexibilityContribution():
         self.sumPathsWithSpecialKeys = len(self.pathsWithSpecialKeys) # sum of all paths with at least one special key on it. Counting each path only once, because there are likely dupliactes.
         
         ## ratios
-        self.pathsWithSpecialKeyRatio = 0 if self.flexibility.sumPaths == 0 else self.sumPathsWithSpecialKeys/self.flexibility.sumPaths
+        self.pathsWithSpecialKeyRatio = 0 if flexibility.sumPaths == 0 else self.sumPathsWithSpecialKeys/flexibility.sumPaths
         
         ### both redundancies
-        self.redundantKeysWithSpecialKeyOnPathsRatio = 0 if self.flexibility.sumRedundantKeys == 0 else self.sumRedundantKeysWithSpecialKeyOnPaths/self.flexibility.sumRedundantKeys
-        self.partiallyRedundantKeysWithSpecialKeyOnPathsRatio = 0 if self.flexibility.sumPartiallyRedundantKeys == 0 else self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths/self.flexibility.sumPartiallyRedundantKeys
+        self.redundantKeysWithSpecialKeyOnPathsRatio = 0 if flexibility.sumRedundantKeys == 0 else self.sumRedundantKeysWithSpecialKeyOnPaths/flexibility.sumRedundantKeys
+        self.partiallyRedundantKeysWithSpecialKeyOnPathsRatio = 0 if flexibility.sumPartiallyRedundantKeys == 0 else self.sumPartiallyRedundantKeysWithSpecialKeyOnPaths/flexibility.sumPartiallyRedundantKeys
         
         ### only target-redundancy
-        self.targetRedundantKeysWithSpecialKeyOnPathsRatio = 0 if self.flexibility.sumTargetRedundantKeys == 0 else self.sumTargetRedundantKeysWithSpecialKeyOnPaths/self.flexibility.sumTargetRedundantKeys
-        self.partiallyTargetRedundantKeysWithSpecialKeyOnPathsRatio = 0 if self.flexibility.sumPartiallyTargetRedundantKeys == 0 else self.sumPartiallyTargetRedundantKeysWithSpecialKeyOnPaths/self.flexibility.sumPartiallyTargetRedundantKeys
+        self.targetRedundantKeysWithSpecialKeyOnPathsRatio = 0 if flexibility.sumTargetRedundantKeys == 0 else self.sumTargetRedundantKeysWithSpecialKeyOnPaths/flexibility.sumTargetRedundantKeys
+        self.partiallyTargetRedundantKeysWithSpecialKeyOnPathsRatio = 0 if flexibility.sumPartiallyTargetRedundantKeys == 0 else self.sumPartiallyTargetRedundantKeysWithSpecialKeyOnPaths/flexibility.sumPartiallyTargetRedundantKeys
         
         ### only source-redundancy
-        self.sourceRedundantKeysWithSpecialKeyOnPathsRatio = 0 if self.flexibility.sumSourceRedundantKeys == 0 else self.sumSourceRedundantKeysWithSpecialKeyOnPaths/self.flexibility.sumSourceRedundantKeys
-        self.partiallySourceRedundantKeysWithSpecialKeyOnPathsRatio = 0 if self.flexibility.sumPartiallySourceRedundantKeys == 0 else self.sumPartiallySourceRedundantKeysWithSpecialKeyOnPaths/self.flexibility.sumPartiallySourceRedundantKeys
+        self.sourceRedundantKeysWithSpecialKeyOnPathsRatio = 0 if flexibility.sumSourceRedundantKeys == 0 else self.sumSourceRedundantKeysWithSpecialKeyOnPaths/flexibility.sumSourceRedundantKeys
+        self.partiallySourceRedundantKeysWithSpecialKeyOnPathsRatio = 0 if flexibility.sumPartiallySourceRedundantKeys == 0 else self.sumPartiallySourceRedundantKeysWithSpecialKeyOnPaths/flexibility.sumPartiallySourceRedundantKeys
         
         
         ## assignments
         ### special key -> keys
+        # each dictionary is built in one go, instead of updating an empty one
         #### both redundancies
-        self.specialKeyOnRedundantKeysPaths = dict()
-        self.specialKeyOnPartiallyRedundantKeysPaths = dict()
+        self.specialKeyOnRedundantKeysPaths = inverseDictOfSets(self.redundantKeySpecialKeysOnPaths)
+        self.specialKeyOnPartiallyRedundantKeysPaths = inverseDictOfSets(self.partiallyRedundantKeySpecialKeysOnPaths)
         
         #### only target-redundancy
-        self.specialKeyOnTargetRedundantKeysPaths = dict()
-        self.specialKeyOnPartiallyTargetRedundantKeysPaths = dict()
+        self.specialKeyOnTargetRedundantKeysPaths = inverseDictOfSets(self.targetRedundantKeySpecialKeysOnPaths)
+        self.specialKeyOnPartiallyTargetRedundantKeysPaths = inverseDictOfSets(self.partiallyTargetRedundantKeySpecialKeysOnPaths)
         
         #### only source-redundancy
-        self.specialKeyOnSourceRedundantKeysPaths = dict()
-        self.specialKeyOnPartiallySourceRedundantKeysPaths = dict()
-        
-        dictionaryPairs = [(self.redundantKeySpecialKeysOnPaths, self.specialKeyOnRedundantKeysPaths), 
-                           (self.partiallyRedundantKeySpecialKeysOnPaths, self.specialKeyOnPartiallyRedundantKeysPaths), 
-                           (self.targetRedundantKeySpecialKeysOnPaths, self.specialKeyOnTargetRedundantKeysPaths), 
-                           (self.partiallyTargetRedundantKeySpecialKeysOnPaths, self.specialKeyOnPartiallyTargetRedundantKeysPaths), 
-                           (self.sourceRedundantKeySpecialKeysOnPaths, self.specialKeyOnSourceRedundantKeysPaths), 
-                           (self.partiallySourceRedundantKeySpecialKeysOnPaths, self.specialKeyOnPartiallySourceRedundantKeysPaths)]
-        for dictA, dictB in dictionaryPairs:
-            for key, specialKeys in dictA.items():
-                for specialKey in specialKeys:
-                    currentSet = dictB.get(specialKey)
-                    if currentSet is None:
-                        currentSet = set()
-                        dictB[specialKey] = currentSet
-                    currentSet.add(key)
+        self.specialKeyOnSourceRedundantKeysPaths = inverseDictOfSets(self.sourceRedundantKeySpecialKeysOnPaths)
+        self.specialKeyOnPartiallySourceRedundantKeysPaths = inverseDictOfSets(self.partiallySourceRedundantKeySpecialKeysOnPaths)
         
 
         
@@ -1375,7 +1424,7 @@ class RedundancyType(Enum):
     Redundancy comes in many forms, some are defined here as constants pointing to their realising classes.
     """
     
-    ROBUSTNESS = [Robustness, 0]
+    ROBUSTNESS = (Robustness, 0)
     """
     If a key element is deleted from a graph, e.g. all enzymes realising a certain EC number are deleted from an organism's genome:    
     Robustness exists if the former substrates and products are still connected, in their original direction, albeit via alternative paths.
@@ -1384,64 +1433,64 @@ class RedundancyType(Enum):
     This means robustness is a sub-type of :attr:`FLEXIBILITY`. Only some flexible edges are also robust. Robustness and flexibility have an inheritance relation.
     """
     
-    ROBUSTNESS_PARTIAL = [Robustness, 1]
+    ROBUSTNESS_PARTIAL = (Robustness, 1)
     """
     This is the same as :attr:`ROBUSTNESS`, but only one of the edges of a key has to be redundant, not all its edges at once. This does *not* include the results of :attr:`ROBUSTNESS`!
     """
     
-    ROBUSTNESS_BOTH = [Robustness, 2]
+    ROBUSTNESS_BOTH = (Robustness, 2)
     """
     This combines the results of both :attr:`ROBUSTNESS` and :attr:`ROBUSTNESS_PARTIAL`.
     """
     
     
-    FLEXIBILITY = [Flexibility, 0]
+    FLEXIBILITY = (Flexibility, 0)
     """
     If a key element is deleted from a graph, e.g. all enzymes realising a certain EC number are deleted from an organism's genome:
     Flexibility exists if the former substrates and/or products can still be metabolised via alternative paths, in their original respective direction.
     This does **not** mean the alternative paths have to include both, the orginal substrate and product, at the same time.
     """
     
-    FLEXIBILITY_PARTIAL = [Flexibility, 1]
+    FLEXIBILITY_PARTIAL = (Flexibility, 1)
     """
     This is the same as :attr:`FLEXIBILITY`, but only one of the edges of a key has to be redundant, not all its edges at once. This does *not* include the results of :attr:`FLEXIBILITY`!
     """
     
-    FLEXIBILITY_BOTH = [Flexibility, 2]
+    FLEXIBILITY_BOTH = (Flexibility, 2)
     """
     This combines the results of both :attr:`FLEXIBILITY` and :attr:`FLEXIBILITY_PARTIAL`.
     """
     
     
-    TARGET_FLEXIBILITY = [Flexibility, 3]
+    TARGET_FLEXIBILITY = (Flexibility, 3)
     """
     This is a super-type of :attr:`FLEXIBILITY`, where only the target node of each edge has to have redundant paths (leading to it), for the whole edge to be counted as redundant. It does not matter whether the source node also has redundant paths.
     Only some target-flexible edges are also flexible, in fact exactly the ones which are also source-flexible. This means that combining target-flexibility with source-flexibility yields flexibility, they have a composition relation.
     """
     
-    TARGET_FLEXIBILITY_PARTIAL = [Flexibility, 4]
+    TARGET_FLEXIBILITY_PARTIAL = (Flexibility, 4)
     """
     This is the same as :attr:`TARGET_FLEXIBILITY`, but only one of the edges of a key has to be redundant, not all its edges at once. This does *not* include the results of :attr:`TARGET_FLEXIBILITY`!
     """
     
-    TARGET_FLEXIBILITY_BOTH = [Flexibility, 5]
+    TARGET_FLEXIBILITY_BOTH = (Flexibility, 5)
     """
     This combines the results of both :attr:`TARGET_FLEXIBILITY` and :attr:`TARGET_FLEXIBILITY_PARTIAL`.
     """
     
     
-    SOURCE_FLEXIBILITY = [Flexibility, 6]
+    SOURCE_FLEXIBILITY = (Flexibility, 6)
     """
     This is a super-type of :attr:`FLEXIBILITY`, where only the source node of each edge has to have redundant paths (leaving from it), for the whole edge to be counted as redundant. It does not matter whether the target node also has redundant paths.
     Only some source-flexible edges are also flexible, in fact exactly the ones which are also target-flexible. This means that combining target-flexibility with source-flexibility yields flexibility, they have a composition relation.
     """
     
-    SOURCE_FLEXIBILITY_PARTIAL = [Flexibility, 7]
+    SOURCE_FLEXIBILITY_PARTIAL = (Flexibility, 7)
     """
     This is the same as :attr:`SOURCE_FLEXIBILITY`, but only one of the edges of a key has to be redundant, not all its edges at once. This does *not* include the results of :attr:`SOURCE_FLEXIBILITY`!
     """
     
-    SOURCE_FLEXIBILITY_BOTH = [Flexibility, 8]
+    SOURCE_FLEXIBILITY_BOTH = (Flexibility, 8)
     """
     This combines the results of both :attr:`SOURCE_FLEXIBILITY` and :attr:`SOURCE_FLEXIBILITY_PARTIAL`.
     """
@@ -1454,10 +1503,253 @@ class RedundancyType(Enum):
     Which can only be prevented (to the extent of our knowledge) by using the more narrow definition of 'robustness', not the broader 'flexibility',
     because the difference of 'flexibility' minus 'robustness' leaves the cases where the graph breaks, but source and/or target are still redundant.
     """
+
+    @property
+    def redundancyClass(self):
+        """
+        The class realising this type of redundancy, either :class:`Robustness` or :class:`Flexibility`.
+        """
+        return self.value[0]
+
+    @property
+    def variant(self) -> int:
+        """
+        The ordinal of this type of redundancy within its realising class.
+        """
+        return self.value[1]
+
+# number each type of redundancy contiguously, so it can index a plain tuple. Hashing an Enum member calls Python code.
+for _index, _redundancyType in enumerate(RedundancyType):
+    _redundancyType.index = _index
+del _index, _redundancyType
+
+def _toJumpTable(attributesForType: Dict[RedundancyType, Tuple[str, Tuple[str, ...]]]) -> Tuple[Tuple[str, Tuple[attrgetter, ...]], ...]:
+    """
+    Turn a table keyed by type of redundancy into a tuple indexed by :attr:`RedundancyType.index`.
+    
+    The names of attributes are compiled into :func:`operator.attrgetter` objects. Types of redundancy missing from `attributesForType` point to *None*.
+    """
+    jumpTable = [None] * len(RedundancyType)
+    for redundancyType, (objectName, attributeNames) in attributesForType.items():
+        jumpTable[redundancyType.index] = (objectName, tuple(attrgetter(attributeName) for attributeName in attributeNames))
+    return tuple(jumpTable)
+
+def _toObjectTable(owner, attributesForType: Tuple[Tuple[str, Tuple[attrgetter, ...]], ...]) -> tuple:
+    """
+    Resolve the robustness/flexibility (contribution) object of `owner` for each type of redundancy once.
+    
+    Parameters
+    ----------
+    owner : Redundancy or RedundancyContribution
+    attributesForType : Tuple[Tuple[str, Tuple[attrgetter, ...]], ...]
+        Any table of `owner`'s attributes, see :func:`_toJumpTable`.
+    
+    Returns
+    -------
+    tuple
+        The object realising each type of redundancy, indexed by :attr:`RedundancyType.index`. *None* if `owner` excluded this type of redundancy.
+    """
+    return tuple(None if attributes is None else getattr(owner, attributes[0], None) for attributes in attributesForType)
+
+
+
+# Attributes realising each type of redundancy, as (name of the Robustness/Flexibility attribute in Redundancy, names of its attributes to be combined).
+_redundancyRatioAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustness', ('redundantKeysRatio',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustness', ('partiallyRedundantKeysRatio',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustness', ('redundantKeysRatio', 'partiallyRedundantKeysRatio')),
+    
+    RedundancyType.FLEXIBILITY: ('flexibility', ('redundantKeysRatio',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibility', ('partiallyRedundantKeysRatio',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibility', ('redundantKeysRatio', 'partiallyRedundantKeysRatio')),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibility', ('targetRedundantKeysRatio',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibility', ('partiallyTargetRedundantKeysRatio',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibility', ('targetRedundantKeysRatio', 'partiallyTargetRedundantKeysRatio')),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibility', ('sourceRedundantKeysRatio',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibility', ('partiallySourceRedundantKeysRatio',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibility', ('sourceRedundantKeysRatio', 'partiallySourceRedundantKeysRatio'))
+})
+
+_redundantKeysAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustness', ('redundantKeys',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustness', ('partiallyRedundantKeys',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustness', ('redundantKeys', 'partiallyRedundantKeys')),
+    
+    RedundancyType.FLEXIBILITY: ('flexibility', ('redundantKeys',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibility', ('partiallyRedundantKeys',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibility', ('redundantKeys', 'partiallyRedundantKeys')),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibility', ('targetRedundantKeys',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibility', ('partiallyTargetRedundantKeys',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibility', ('targetRedundantKeys', 'partiallyTargetRedundantKeys')),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibility', ('sourceRedundantKeys',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibility', ('partiallySourceRedundantKeys',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibility', ('sourceRedundantKeys', 'partiallySourceRedundantKeys'))
+})
+
+_redundancyPathsAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustness', ('paths',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustness', ('paths',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustness', ('paths',)),
+    
+    RedundancyType.FLEXIBILITY: ('flexibility', ('paths',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibility', ('paths',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibility', ('paths',)),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibility', ('targetPaths',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibility', ('targetPaths',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibility', ('targetPaths',)),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibility', ('sourcePaths',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibility', ('sourcePaths',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibility', ('sourcePaths',))
+})
+
+
+_redundancyPathsForKeyAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustness', ('redundantKeyPaths',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustness', ('partiallyRedundantKeyPaths',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustness', ('redundantKeyPaths', 'partiallyRedundantKeyPaths')),
+    
+    RedundancyType.FLEXIBILITY: ('flexibility', ('redundantKeyPaths',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibility', ('partiallyRedundantKeyPaths',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibility', ('redundantKeyPaths', 'partiallyRedundantKeyPaths')),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibility', ('targetRedundantKeyPaths',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibility', ('partiallyTargetRedundantKeyPaths',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibility', ('targetRedundantKeyPaths', 'partiallyTargetRedundantKeyPaths')),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibility', ('sourceRedundantKeyPaths',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibility', ('partiallySourceRedundantKeyPaths',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibility', ('sourceRedundantKeyPaths', 'partiallySourceRedundantKeyPaths'))
+})
+
+
+def _getGetters(owner, attributesForType: Tuple[Tuple[str, Tuple[attrgetter, ...]], ...], redundancyType: RedundancyType) -> Tuple[object, Tuple[attrgetter, ...]]:
+    """
+    Get the object realising `redundancyType` and the getters of its attributes, looked up in `attributesForType`.
+    
+    Parameters
+    ----------
+    owner : Redundancy or RedundancyContribution
+        Object holding the robustness/flexibility (contribution) objects, resolved by :func:`_toObjectTable` into `owner._redundancyObjects`.
+    attributesForType : Tuple[Tuple[str, Tuple[attrgetter, ...]], ...]
+        Table of (name of the robustness/flexibility object in `owner`, getters of its attributes), indexed by :attr:`RedundancyType.index`, see :func:`_toJumpTable`.
+    redundancyType : RedundancyType
+    
+    Returns
+    -------
+    Tuple[object, Tuple[attrgetter, ...]]
+        The robustness/flexibility (contribution) object, and the getters of all attributes listed for `redundancyType`, in order.
+    
+    Raises
+    ------
+    ValueError
+        If `redundancyType` is unknown, or if `onlyType` was given in the contructor, but metrics of another type of redundancy are to be returned here.
+    """
+    try:
+        index = redundancyType.index
+    except AttributeError: # not a RedundancyType at all
+        index = None
+    if index is None or attributesForType[index] is None:
+        raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
+    
+    redundancyObject = owner._redundancyObjects[index]
+    if redundancyObject is None:
+        raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+    
+    return redundancyObject, attributesForType[index][1]
+
+def _getAttributes(owner, attributesForType: Tuple[Tuple[str, Tuple[attrgetter, ...]], ...], redundancyType: RedundancyType) -> list:
+    """
+    Get the values of the attributes realising `redundancyType`, see :func:`_getGetters`.
+    
+    Returns
+    -------
+    list
+        The values of all attributes listed for `redundancyType`, in order.
+    """
+    redundancyObject, getters = _getGetters(owner, attributesForType, redundancyType)
+    return [getter(redundancyObject) for getter in getters]
+
+def _getAttribute(owner, attributesForType: Tuple[Tuple[str, Tuple[attrgetter, ...]], ...], redundancyType: RedundancyType):
+    """
+    Get the value of the only attribute realising `redundancyType`, see :func:`_getGetters`.
+    
+    Only for tables listing a single attribute per type of redundancy, saves building a list.
+    """
+    redundancyObject, (getter,) = _getGetters(owner, attributesForType, redundancyType)
+    return getter(redundancyObject)
+
+def _mergeDictsOfSets(dicts: List[Dict[Element, Set]]) -> Dict[Element, Set]:
+    """
+    Merge dictionaries of sets into a new dictionary, without changing any of them.
+    
+    Parameters
+    ----------
+    dicts : List[Dict[Element, Set]]
+    
+    Returns
+    -------
+    Dict[Element, Set]
+        Every key of any of `dicts`. If a key exists in more than one of `dicts`, it points to the union of its sets.
+    """
+    merged = dict(dicts[0])
+    for otherDict in dicts[1:]:
+        for key, values in otherDict.items():
+            existingValues = merged.get(key)
+            if existingValues is None:
+                merged[key] = values
+            else:
+                merged[key] = existingValues | values
+    return merged
+
+def _getMergedAttributes(owner, attributesForType: Tuple[Tuple[str, Tuple[attrgetter, ...]], ...], redundancyType: RedundancyType, mergedCache: Dict[int, Dict[Element, Set]]) -> Dict[Element, Set]:
+    """
+    Get the dictionary of sets realising `redundancyType`, merging the dictionaries of *_BOTH types.
+    
+    Parameters
+    ----------
+    owner : Redundancy or RedundancyContribution
+    attributesForType : Tuple[Tuple[str, Tuple[attrgetter, ...]], ...]
+        See :func:`_getGetters`.
+    redundancyType : RedundancyType
+    mergedCache : Dict[int, Dict[Element, Set]]
+        Dictionaries already merged, keyed by :attr:`RedundancyType.index`. Will be extended by the dictionary merged here.
+    
+    Returns
+    -------
+    Dict[Element, Set]
+        The dictionary itself, or the merged dictionary, see :func:`_mergeDictsOfSets`. Do not change it, it is shared!
+    
+    Raises
+    ------
+    ValueError
+        See :func:`_getGetters`.
+    """
+    dicts = _getAttributes(owner, attributesForType, redundancyType)
     
+    if len(dicts) == 1:
+        return dicts[0]
+    
+    # merge *_BOTH dictionaries only once, without mutating the underlying ones
+    merged = mergedCache.get(redundancyType.index)
+    if merged is None:
+        merged = _mergeDictsOfSets(dicts)
+        mergedCache[redundancyType.index] = merged
+    
+    return merged
+
+
+
 class Redundancy():
     
-    def __init__(self, graph: DirectedMultiGraph, onlyLargestComponent = False, onlyType: RedundancyType = None):
+    __slots__ = ('onlyType', 'robustness', 'flexibility', '_redundantKeys', '_paths', '_pathsForKey', '_redundancyObjects')
+    
+    def __init__(self, graph: DirectedMultiGraph, onlyLargestComponent = False, onlyType: RedundancyType = None, flexibilityInProcessPool = False):
         """
         Redundancy metrics, consisting of :class:`Flexibility` and class:`Robustness`.
         
@@ -1471,6 +1763,9 @@ class Redundancy():
             If *True*, reduce `graph` to its largest component before measuring redundancy.
         onlyType : RedundancyType, optional
             If give, only metrics for this type of redundancy are actually calculated. Requests for metrics of another type of redundancy will raise an error!
+        flexibilityInProcessPool : bool, optional
+            If *True*, `onlyType` is *None*, and :attr:`FEV_KEGG.Util.Parallelism.processPool` exists, :class:`Flexibility` is calculated in the process pool while :class:`Robustness` is calculated in the current process.
+            This pickles `graph` to the pool and the resulting :class:`Flexibility` back, only worth it if you actually need both types of redundancy. Ignored inside a worker process.
         
         Attributes
         ----------
@@ -1484,11 +1779,30 @@ class Redundancy():
         """
         self.onlyType = onlyType
         
-        if onlyType is None or onlyType.value[0] is Flexibility:
-            self.flexibility = Flexibility(graph, onlyLargestComponent)
+        # lazily computed results of the getters, keyed by RedundancyType.index. Frozen, so they can be shared with every caller. The underlying properties build them anew on every access.
+        self._redundantKeys = dict() # Dict[int, FrozenSet[Element]]
+        self._paths = dict() # Dict[int, FrozenSet[Path]]
+        self._pathsForKey = dict() # Dict[int, Dict[Element, FrozenSet[Path]]]
         
-        if onlyType is None or onlyType.value[0] is Robustness:
+        if onlyType is None and onlyLargestComponent:
+            # both need the largest component, extract it only once. Each still works on its own copy.
+            graph = graph.getLargestComponent()
+            onlyLargestComponent = False
+        
+        if flexibilityInProcessPool is True and onlyType is None and Parallelism.processPool is not None and Parallelism.isMainProcess():
+            # flexibility and robustness are independent of each other, calculate flexibility in the process pool meanwhile
+            flexibilityFuture = Parallelism.processPool.submit(Flexibility, graph, onlyLargestComponent)
             self.robustness = Robustness(graph, onlyLargestComponent)
+            self.flexibility = flexibilityFuture.result()
+        
+        else:
+            if onlyType is None or onlyType.redundancyClass is Flexibility:
+                self.flexibility = Flexibility(graph, onlyLargestComponent)
+            
+            if onlyType is None or onlyType.redundancyClass is Robustness:
+                self.robustness = Robustness(graph, onlyLargestComponent)
+        
+        self._redundancyObjects = _toObjectTable(self, _redundancyRatioAttributes)
     
     def getRedundancyRatio(self, redundancyType: RedundancyType = RedundancyType.default) -> float:
         """
@@ -1508,54 +1822,9 @@ class Redundancy():
         ValueError
             If `onlyType` was given in the contructor, but metrics of another type of redundancy are to be returned here.
         """
-        try:
-            if redundancyType is RedundancyType.ROBUSTNESS:
-                return self.robustness.redundantKeysRatio
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_PARTIAL:
-                return self.robustness.partiallyRedundantKeysRatio
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_BOTH:
-                return self.robustness.redundantKeysRatio + self.robustness.partiallyRedundantKeysRatio
-            
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY:
-                return self.flexibility.redundantKeysRatio
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallyRedundantKeysRatio
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_BOTH:
-                return self.flexibility.redundantKeysRatio + self.flexibility.partiallyRedundantKeysRatio
-            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY:
-                return self.flexibility.targetRedundantKeysRatio
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallyTargetRedundantKeysRatio
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_BOTH:
-                return self.flexibility.targetRedundantKeysRatio + self.flexibility.partiallyTargetRedundantKeysRatio
-            
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY:
-                return self.flexibility.sourceRedundantKeysRatio
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallySourceRedundantKeysRatio
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_BOTH:
-                return self.flexibility.sourceRedundantKeysRatio + self.flexibility.partiallySourceRedundantKeysRatio
-            
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
-            
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        return sum(_getAttributes(self, _redundancyRatioAttributes, redundancyType))
     
-    def getRedundantKeys(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[Element]:
+    def getRedundantKeys(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[Element]:
         """
         Get redundant key elements.
         
@@ -1566,61 +1835,22 @@ class Redundancy():
         
         Returns
         -------
-        Set[Element]
+        FrozenSet[Element]
         
         Raises
         ------
         ValueError
             If `onlyType` was given in the contructor, but metrics of another type of redundancy are to be returned here.
         """
-        try:
-            if redundancyType is RedundancyType.ROBUSTNESS:
-                return self.robustness.redundantKeys
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_PARTIAL:
-                return self.robustness.partiallyRedundantKeys            
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_BOTH:
-                return self.robustness.redundantKeys.union( self.robustness.partiallyRedundantKeys )
-            
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY:
-                return self.flexibility.redundantKeys
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallyRedundantKeys
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_BOTH:
-                return self.flexibility.redundantKeys.union( self.flexibility.partiallyRedundantKeys )
-            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY:
-                return self.flexibility.targetRedundantKeys
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallyTargetRedundantKeys
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_BOTH:
-                return self.flexibility.targetRedundantKeys.union( self.flexibility.partiallyTargetRedundantKeys )
-            
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY:
-                return self.flexibility.sourceRedundantKeys
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallySourceRedundantKeys
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_BOTH:
-                return self.flexibility.sourceRedundantKeys.union( self.flexibility.partiallySourceRedundantKeys )
-            
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
+        redundantKeys = self._redundantKeys.get(getattr(redundancyType, 'index', None)) # unknown types are reported by _getGetters()
+        if redundantKeys is None:
+            keySets = _getAttributes(self, _redundantKeysAttributes, redundancyType)
+            redundantKeys = frozenset(keySets[0]).union( *keySets[1:] )
+            self._redundantKeys[redundancyType.index] = redundantKeys
         
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        return redundantKeys
         
-    def getRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[Path]:
+    def getRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[Path]:
         """
         Get all paths providing redundancy.
         
@@ -1633,33 +1863,21 @@ class Redundancy():
         
         Returns
         -------
-        Set[Path]
+        FrozenSet[Path]
         
         Raises
         ------
         ValueError
             If `onlyType` was given in the contructor, but metrics of another type of redundancy are to be returned here.
         """
-        try:
-            if redundancyType in [RedundancyType.ROBUSTNESS, RedundancyType.ROBUSTNESS_PARTIAL, RedundancyType.ROBUSTNESS_BOTH]:
-                return self.robustness.paths
-            
-            elif redundancyType in [RedundancyType.FLEXIBILITY, RedundancyType.FLEXIBILITY_PARTIAL, RedundancyType.FLEXIBILITY_BOTH]:
-                return self.flexibility.paths
-            
-            elif redundancyType in [RedundancyType.TARGET_FLEXIBILITY, RedundancyType.TARGET_FLEXIBILITY_PARTIAL, RedundancyType.TARGET_FLEXIBILITY_BOTH]:
-                return self.flexibility.targetPaths
-            
-            elif redundancyType in [RedundancyType.SOURCE_FLEXIBILITY, RedundancyType.SOURCE_FLEXIBILITY_PARTIAL, RedundancyType.SOURCE_FLEXIBILITY_BOTH]:
-                return self.flexibility.sourcePaths
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
+        frozenPaths = self._paths.get(getattr(redundancyType, 'index', None))
+        if frozenPaths is None:
+            frozenPaths = frozenset(_getAttribute(self, _redundancyPathsAttributes, redundancyType))
+            self._paths[redundancyType.index] = frozenPaths
         
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        return frozenPaths
     
-    def getRedundancyPathsForKey(self, redundancyType: RedundancyType = RedundancyType.default) -> Dict[Element, Set[Path]]:
+    def getRedundancyPathsForKey(self, redundancyType: RedundancyType = RedundancyType.default) -> Dict[Element, FrozenSet[Path]]:
         """
         Get paths providing redundancy, keyed by the key element they provide redundancy for.
         
@@ -1670,74 +1888,121 @@ class Redundancy():
         
         Returns
         -------
-        Dict[Element, Set[Path]]
+        Dict[Element, FrozenSet[Path]]
+            Do not change the dictionary, it is shared!
         
         Raises
         ------
         ValueError
             If `onlyType` was given in the contructor, but metrics of another type of redundancy are to be returned here.
         """
-        try:
-            if redundancyType is RedundancyType.ROBUSTNESS:
-                return self.robustness.redundantKeyPaths
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_PARTIAL:
-                return self.robustness.partiallyRedundantKeyPaths
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_BOTH:
-                both = self.robustness.redundantKeyPaths
-                both.update( self.robustness.partiallyRedundantKeyPaths )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY:
-                return self.flexibility.redundantKeyPaths
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallyRedundantKeyPaths
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_BOTH:
-                both = self.flexibility.redundantKeyPaths
-                both.update( self.flexibility.partiallyRedundantKeyPaths )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY:
-                return self.flexibility.targetRedundantKeyPaths
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallyTargetRedundantKeyPaths
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_BOTH:
-                both = self.flexibility.targetRedundantKeyPaths
-                both.update( self.flexibility.partiallyTargetRedundantKeyPaths )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY:
-                return self.flexibility.sourceRedundantKeyPaths
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_PARTIAL:
-                return self.flexibility.partiallySourceRedundantKeyPaths
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_BOTH:
-                both = self.flexibility.sourceRedundantKeyPaths
-                both.update( self.flexibility.partiallySourceRedundantKeyPaths )
-                return both
-            
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
+        pathsForKey = self._pathsForKey.get(getattr(redundancyType, 'index', None))
+        if pathsForKey is None:
+            mergedPathsForKey = _getMergedAttributes(self, _redundancyPathsForKeyAttributes, redundancyType, dict())
+            pathsForKey = {key: frozenset(paths) for key, paths in mergedPathsForKey.items()}
+            self._pathsForKey[redundancyType.index] = pathsForKey
         
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        return pathsForKey
 
 
 
+# Attributes realising each type of redundancy in RedundancyContribution, see _getGetters(). For *_BOTH, these are the two sums of contributed keys, followed by the two sums of all keys.
+_keyContributionRatioAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustnessContribution', ('redundantKeysWithSpecialKeyOnPathsRatio',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustnessContribution', ('partiallyRedundantKeysWithSpecialKeyOnPathsRatio',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustnessContribution', ('sumRedundantKeysWithSpecialKeyOnPaths', 'sumPartiallyRedundantKeysWithSpecialKeyOnPaths', 'robustness.sumRedundantKeys', 'robustness.sumPartiallyRedundantKeys')),
+    
+    RedundancyType.FLEXIBILITY: ('flexibilityContribution', ('redundantKeysWithSpecialKeyOnPathsRatio',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallyRedundantKeysWithSpecialKeyOnPathsRatio',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibilityContribution', ('sumRedundantKeysWithSpecialKeyOnPaths', 'sumPartiallyRedundantKeysWithSpecialKeyOnPaths', 'flexibility.sumRedundantKeys', 'flexibility.sumPartiallyRedundantKeys')),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibilityContribution', ('targetRedundantKeysWithSpecialKeyOnPathsRatio',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallyTargetRedundantKeysWithSpecialKeyOnPathsRatio',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibilityContribution', ('sumTargetRedundantKeysWithSpecialKeyOnPaths', 'sumPartiallyTargetRedundantKeysWithSpecialKeyOnPaths', 'flexibility.sumTargetRedundantKeys', 'flexibility.sumPartiallyTargetRedundantKeys')),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibilityContribution', ('sourceRedundantKeysWithSpecialKeyOnPathsRatio',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallySourceRedundantKeysWithSpecialKeyOnPathsRatio',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibilityContribution', ('sumSourceRedundantKeysWithSpecialKeyOnPaths', 'sumPartiallySourceRedundantKeysWithSpecialKeyOnPaths', 'flexibility.sumSourceRedundantKeys', 'flexibility.sumPartiallySourceRedundantKeys'))
+})
+
+_contributedKeysForSpecialAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustnessContribution', ('specialKeyOnRedundantKeysPaths',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustnessContribution', ('specialKeyOnPartiallyRedundantKeysPaths',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustnessContribution', ('specialKeyOnRedundantKeysPaths', 'specialKeyOnPartiallyRedundantKeysPaths')),
+    
+    RedundancyType.FLEXIBILITY: ('flexibilityContribution', ('specialKeyOnRedundantKeysPaths',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('specialKeyOnPartiallyRedundantKeysPaths',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibilityContribution', ('specialKeyOnRedundantKeysPaths', 'specialKeyOnPartiallyRedundantKeysPaths')),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibilityContribution', ('specialKeyOnTargetRedundantKeysPaths',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('specialKeyOnPartiallyTargetRedundantKeysPaths',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibilityContribution', ('specialKeyOnTargetRedundantKeysPaths', 'specialKeyOnPartiallyTargetRedundantKeysPaths')),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibilityContribution', ('specialKeyOnSourceRedundantKeysPaths',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('specialKeyOnPartiallySourceRedundantKeysPaths',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibilityContribution', ('specialKeyOnSourceRedundantKeysPaths', 'specialKeyOnPartiallySourceRedundantKeysPaths'))
+})
+
+_contributingSpecialForKeyAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustnessContribution', ('redundantKeySpecialKeysOnPaths',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustnessContribution', ('partiallyRedundantKeySpecialKeysOnPaths',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustnessContribution', ('redundantKeySpecialKeysOnPaths', 'partiallyRedundantKeySpecialKeysOnPaths')),
+    
+    RedundancyType.FLEXIBILITY: ('flexibilityContribution', ('redundantKeySpecialKeysOnPaths',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallyRedundantKeySpecialKeysOnPaths',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibilityContribution', ('redundantKeySpecialKeysOnPaths', 'partiallyRedundantKeySpecialKeysOnPaths')),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibilityContribution', ('targetRedundantKeySpecialKeysOnPaths',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallyTargetRedundantKeySpecialKeysOnPaths',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibilityContribution', ('targetRedundantKeySpecialKeysOnPaths', 'partiallyTargetRedundantKeySpecialKeysOnPaths')),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibilityContribution', ('sourceRedundantKeySpecialKeysOnPaths',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallySourceRedundantKeySpecialKeysOnPaths',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibilityContribution', ('sourceRedundantKeySpecialKeysOnPaths', 'partiallySourceRedundantKeySpecialKeysOnPaths'))
+})
+
+_contributedPathsAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustnessContribution', ('pathsWithSpecialKeys',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustnessContribution', ('pathsWithSpecialKeys',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustnessContribution', ('pathsWithSpecialKeys',)),
+    
+    RedundancyType.FLEXIBILITY: ('flexibilityContribution', ('pathsWithSpecialKeys',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('pathsWithSpecialKeys',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibilityContribution', ('pathsWithSpecialKeys',)),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibilityContribution', ('targetPathsWithSpecialKeys',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('targetPathsWithSpecialKeys',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibilityContribution', ('targetPathsWithSpecialKeys',)),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibilityContribution', ('sourcePathsWithSpecialKeys',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('sourcePathsWithSpecialKeys',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibilityContribution', ('sourcePathsWithSpecialKeys',))
+})
+
+_contributedPathsForKeyAttributes = _toJumpTable({
+    RedundancyType.ROBUSTNESS: ('robustnessContribution', ('redundantKeyPathsWithSpecialKey',)),
+    RedundancyType.ROBUSTNESS_PARTIAL: ('robustnessContribution', ('partiallyRedundantKeyPathsWithSpecialKey',)),
+    RedundancyType.ROBUSTNESS_BOTH: ('robustnessContribution', ('redundantKeyPathsWithSpecialKey', 'partiallyRedundantKeyPathsWithSpecialKey')),
+    
+    RedundancyType.FLEXIBILITY: ('flexibilityContribution', ('redundantKeyPathsWithSpecialKey',)),
+    RedundancyType.FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallyRedundantKeyPathsWithSpecialKey',)),
+    RedundancyType.FLEXIBILITY_BOTH: ('flexibilityContribution', ('redundantKeyPathsWithSpecialKey', 'partiallyRedundantKeyPathsWithSpecialKey')),
+    
+    RedundancyType.TARGET_FLEXIBILITY: ('flexibilityContribution', ('targetRedundantKeyPathsWithSpecialKey',)),
+    RedundancyType.TARGET_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallyTargetRedundantKeyPathsWithSpecialKey',)),
+    RedundancyType.TARGET_FLEXIBILITY_BOTH: ('flexibilityContribution', ('targetRedundantKeyPathsWithSpecialKey', 'partiallyTargetRedundantKeyPathsWithSpecialKey')),
+    
+    RedundancyType.SOURCE_FLEXIBILITY: ('flexibilityContribution', ('sourceRedundantKeyPathsWithSpecialKey',)),
+    RedundancyType.SOURCE_FLEXIBILITY_PARTIAL: ('flexibilityContribution', ('partiallySourceRedundantKeyPathsWithSpecialKey',)),
+    RedundancyType.SOURCE_FLEXIBILITY_BOTH: ('flexibilityContribution', ('sourceRedundantKeyPathsWithSpecialKey', 'partiallySourceRedundantKeyPathsWithSpecialKey'))
+})
+
 
 class RedundancyContribution():
+    
+    __slots__ = ('redundancy', 'collectPaths', 'robustnessContribution', 'flexibilityContribution', '_bothKeysForSpecial', '_bothSpecialForKey', '_bothPathsForKey', '_paths', '_redundancyObjects')
 
-    def __init__(self, redundancy: Redundancy, specialKeys: Set[Element]):
+    def __init__(self, redundancy: Redundancy, specialKeys: Set[Element], collectPaths = True):
         """
         Contribution to redundancy, consisting of :class:`Flexibility` and class:`Robustness`, accountable to edges with `specialKeys`.
         
@@ -1748,23 +2013,36 @@ class RedundancyContribution():
         redundancy : Redundancy
         specialKeys : Set[Element]
             Set of key elements viewed to be somehow special. One type of special could be 'neofunctionalised'.
+        collectPaths : bool, optional
+            If *False*, the marked paths are not collected per key, saving time and memory if only ratios and special keys are of interest. The attributes holding paths per key are then *None*.
         
         Attributes
         ----------
         self.flexibilityContribution : FlexibilityContribution
         self.robustnessContribution : RobustnessContribution
+        self.collectPaths : bool
         """
         self.redundancy = redundancy
+        self.collectPaths = collectPaths
+        
+        # lazily merged results of *_BOTH types, keyed by RedundancyType.index
+        self._bothKeysForSpecial = dict() # Dict[int, Dict[Element, Set[Element]]]
+        self._bothSpecialForKey = dict() # Dict[int, Dict[Element, Set[Element]]]
+        self._bothPathsForKey = dict() # Dict[int, Dict[Element, Set[MarkedPath]]]
+        
+        self._paths = dict() # Dict[int, FrozenSet[MarkedPath]] lazily frozen results of getContributedPaths(), keyed by RedundancyType.index
         onlyType = redundancy.onlyType
         
-        if onlyType is None or onlyType.value[0] is Flexibility:
-            self.flexibilityContribution = FlexibilityContribution(redundancy.flexibility, specialKeys)
+        if onlyType is None or onlyType.redundancyClass is Flexibility:
+            self.flexibilityContribution = FlexibilityContribution(redundancy.flexibility, specialKeys, collectPaths)
+        
+        if onlyType is None or onlyType.redundancyClass is Robustness:
+            self.robustnessContribution = RobustnessContribution(redundancy.robustness, specialKeys, collectPaths)
         
-        if onlyType is None or onlyType.value[0] is Robustness:
-            self.robustnessContribution = RobustnessContribution(redundancy.robustness, specialKeys)
+        self._redundancyObjects = _toObjectTable(self, _keyContributionRatioAttributes)
     
     @classmethod
-    def fromGraph(cls, graph: DirectedMultiGraph, specialKeys: Set[Element]):
+    def fromGraph(cls, graph: DirectedMultiGraph, specialKeys: Set[Element], collectPaths = True):
         """
         Create RedundancyContribution object from `graph`.
         
@@ -1772,12 +2050,13 @@ class RedundancyContribution():
         ----------
         graph : DirectedMultiGraph
         specialKeys : Set[Element]
+        collectPaths : bool, optional
         
         Returns
         -------
         RedundancyContribution
         """
-        return cls(Redundancy(graph), specialKeys)
+        return cls(Redundancy(graph), specialKeys, collectPaths)
     
     
     
@@ -1800,60 +2079,15 @@ class RedundancyContribution():
         ValueError
             If `onlyType` was given in the contructor of the underlying redundancy object, but metrics of another type of redundancy are to be returned here.
         """
-        try:
-            if redundancyType is RedundancyType.ROBUSTNESS:
-                return self.robustnessContribution.redundantKeysWithSpecialKeyOnPathsRatio            
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_PARTIAL:
-                return self.robustnessContribution.partiallyRedundantKeysWithSpecialKeyOnPathsRatio
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_BOTH:
-                contributedKeys = self.robustnessContribution.sumRedundantKeysWithSpecialKeyOnPaths + self.robustnessContribution.sumPartiallyRedundantKeysWithSpecialKeyOnPaths
-                sumKeys = self.robustnessContribution.robustness.sumRedundantKeys + self.robustnessContribution.robustness.sumPartiallyRedundantKeys
-                return contributedKeys / sumKeys
-            
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY:
-                return self.flexibilityContribution.redundantKeysWithSpecialKeyOnPathsRatio
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallyRedundantKeysWithSpecialKeyOnPathsRatio
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_BOTH:
-                contributedKeys = self.flexibilityContribution.sumRedundantKeysWithSpecialKeyOnPaths + self.flexibilityContribution.sumPartiallyRedundantKeysWithSpecialKeyOnPaths
-                sumKeys = self.flexibilityContribution.robustness.sumRedundantKeys + self.flexibilityContribution.robustness.sumPartiallyRedundantKeys
-                return contributedKeys / sumKeys
-            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY:
-                return self.flexibilityContribution.targetRedundantKeysWithSpecialKeyOnPathsRatio
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallyTargetRedundantKeysWithSpecialKeyOnPathsRatio
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_BOTH:
-                contributedKeys = self.flexibilityContribution.sumTargetRedundantKeysWithSpecialKeyOnPaths + self.flexibilityContribution.sumPartiallyTargetRedundantKeysWithSpecialKeyOnPaths
-                sumKeys = self.flexibilityContribution.robustness.sumTargetRedundantKeys + self.flexibilityContribution.robustness.sumPartiallyTargetRedundantKeys
-                return contributedKeys / sumKeys
-            
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY:
-                return self.flexibilityContribution.sourceRedundantKeysWithSpecialKeyOnPathsRatio
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallySourceRedundantKeysWithSpecialKeyOnPathsRatio
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_BOTH:
-                contributedKeys = self.flexibilityContribution.sumSourceRedundantKeysWithSpecialKeyOnPaths + self.flexibilityContribution.sumPartiallySourceRedundantKeysWithSpecialKeyOnPaths
-                sumKeys = self.flexibilityContribution.robustness.sumSourceRedundantKeys + self.flexibilityContribution.robustness.sumPartiallySourceRedundantKeys
-                return contributedKeys / sumKeys
-            
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
+        values = _getAttributes(self, _keyContributionRatioAttributes, redundancyType)
+        
+        if len(values) == 1:
+            return values[0]
         
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        else: # *_BOTH
+            contributedKeysFull, contributedKeysPartial, sumKeysFull, sumKeysPartial = values
+            sumKeys = sumKeysFull + sumKeysPartial
+            return 0 if sumKeys == 0 else (contributedKeysFull + contributedKeysPartial) / sumKeys
     
     def getContributedKeysForSpecial(self, redundancyType: RedundancyType = RedundancyType.default) -> Dict[Element, Set[Element]]:
         """
@@ -1874,60 +2108,7 @@ class RedundancyContribution():
         ValueError
             If `onlyType` was given in the contructor of the underlying redundancy object, but metrics of another type of redundancy are to be returned here.
         """
-        try:
-            if redundancyType is RedundancyType.ROBUSTNESS:
-                return self.robustnessContribution.specialKeyOnRedundantKeysPaths            
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_PARTIAL:
-                return self.robustnessContribution.specialKeyOnPartiallyRedundantKeysPaths
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_BOTH:
-                dictA = self.robustnessContribution.specialKeyOnRedundantKeysPaths  
-                dictB = self.robustnessContribution.specialKeyOnPartiallyRedundantKeysPaths
-                return updateDictUpdatingValue(dictA, dictB)
-            
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY:
-                return self.flexibilityContribution.specialKeyOnRedundantKeysPaths
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.specialKeyOnPartiallyRedundantKeysPaths
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_BOTH:
-                dictA = self.flexibilityContribution.specialKeyOnRedundantKeysPaths  
-                dictB = self.flexibilityContribution.specialKeyOnPartiallyRedundantKeysPaths
-                return updateDictUpdatingValue(dictA, dictB)
-            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY:
-                return self.flexibilityContribution.specialKeyOnTargetRedundantKeysPaths            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.specialKeyOnPartiallyTargetRedundantKeysPaths            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_BOTH:
-                dictA = self.flexibilityContribution.specialKeyOnTargetRedundantKeysPaths  
-                dictB = self.flexibilityContribution.specialKeyOnPartiallyTargetRedundantKeysPaths
-                return updateDictUpdatingValue(dictA, dictB)
-            
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY:
-                return self.flexibilityContribution.specialKeyOnSourceRedundantKeysPaths
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.specialKeyOnPartiallySourceRedundantKeysPaths
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_BOTH:
-                dictA = self.flexibilityContribution.specialKeyOnSourceRedundantKeysPaths  
-                dictB = self.flexibilityContribution.specialKeyOnPartiallySourceRedundantKeysPaths
-                return updateDictUpdatingValue(dictA, dictB)
-            
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
-        
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        return _getMergedAttributes(self, _contributedKeysForSpecialAttributes, redundancyType, self._bothKeysForSpecial)
     
     def getContributingSpecialForKey(self, redundancyType: RedundancyType = RedundancyType.default) -> Dict[Element, Set[Element]]:
         """
@@ -1948,62 +2129,9 @@ class RedundancyContribution():
         ValueError
             If `onlyType` was given in the contructor of the underlying redundancy object, but metrics of another type of redundancy are to be returned here.
         """
-        try:
-            if redundancyType is RedundancyType.ROBUSTNESS:
-                return self.robustnessContribution.redundantKeySpecialKeysOnPaths            
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_PARTIAL:
-                return self.robustnessContribution.partiallyRedundantKeySpecialKeysOnPaths
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_BOTH:
-                both = self.robustnessContribution.redundantKeySpecialKeysOnPaths
-                both.update( self.robustnessContribution.partiallyRedundantKeySpecialKeysOnPaths )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY:
-                return self.flexibilityContribution.redundantKeySpecialKeysOnPaths
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallyRedundantKeySpecialKeysOnPaths
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_BOTH:
-                both = self.flexibilityContribution.redundantKeySpecialKeysOnPaths
-                both.update( self.flexibilityContribution.partiallyRedundantKeySpecialKeysOnPaths )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY:
-                return self.flexibilityContribution.targetRedundantKeySpecialKeysOnPaths
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallyTargetRedundantKeySpecialKeysOnPaths
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_BOTH:
-                both = self.flexibilityContribution.targetRedundantKeySpecialKeysOnPaths
-                both.update( self.flexibilityContribution.partiallyTargetRedundantKeySpecialKeysOnPaths )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY:
-                return self.flexibilityContribution.sourceRedundantKeySpecialKeysOnPaths
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallySourceRedundantKeySpecialKeysOnPaths
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_BOTH:
-                both = self.flexibilityContribution.sourceRedundantKeySpecialKeysOnPaths
-                both.update( self.flexibilityContribution.partiallySourceRedundantKeySpecialKeysOnPaths )
-                return both
-            
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
-        
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        return _getMergedAttributes(self, _contributingSpecialForKeyAttributes, redundancyType, self._bothSpecialForKey)
         
-    def getContributedPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[MarkedPath]:
+    def getContributedPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[MarkedPath]:
         """
         Get all paths on which any special key contributes to redundancy.
         
@@ -2016,7 +2144,7 @@ class RedundancyContribution():
         
         Returns
         -------
-        Set[MarkedPath]
+        FrozenSet[MarkedPath]
             Set of marked redundant paths that contain a special key.
         
         Raises
@@ -2024,24 +2152,12 @@ class RedundancyContribution():
         ValueError
             If `onlyType` was given in the contructor of the underlying redundancy object, but metrics of another type of redundancy are to be returned here.
         """
-        try:
-            if redundancyType in [RedundancyType.ROBUSTNESS, RedundancyType.ROBUSTNESS_PARTIAL, RedundancyType.ROBUSTNESS_BOTH]:
-                return self.robustnessContribution.pathsWithSpecialKeys
-            
-            elif redundancyType in [RedundancyType.FLEXIBILITY, RedundancyType.FLEXIBILITY_PARTIAL, RedundancyType.FLEXIBILITY_BOTH]:
-                return self.flexibilityContribution.pathsWithSpecialKeys
-            
-            elif redundancyType in [RedundancyType.TARGET_FLEXIBILITY, RedundancyType.TARGET_FLEXIBILITY_PARTIAL, RedundancyType.TARGET_FLEXIBILITY_BOTH]:
-                return self.flexibilityContribution.targetPathsWithSpecialKeys
-            
-            elif redundancyType in [RedundancyType.SOURCE_FLEXIBILITY, RedundancyType.SOURCE_FLEXIBILITY_PARTIAL, RedundancyType.SOURCE_FLEXIBILITY_BOTH]:
-                return self.flexibilityContribution.sourcePathsWithSpecialKeys
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
+        frozenPaths = self._paths.get(getattr(redundancyType, 'index', None))
+        if frozenPaths is None:
+            frozenPaths = frozenset(_getAttribute(self, _contributedPathsAttributes, redundancyType))
+            self._paths[redundancyType.index] = frozenPaths
         
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        return frozenPaths
     
     def getContributedPathsForKey(self, redundancyType: RedundancyType = RedundancyType.default) -> Dict[Element, Set[MarkedPath]]:
         """
@@ -2061,67 +2177,20 @@ class RedundancyContribution():
         ------
         ValueError
             If `onlyType` was given in the contructor of the underlying redundancy object, but metrics of another type of redundancy are to be returned here.
+            If `collectPaths` was *False* in the constructor.
         """
-        try:
-            if redundancyType is RedundancyType.ROBUSTNESS:
-                return self.robustnessContribution.redundantKeyPathsWithSpecialKey
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_PARTIAL:
-                return self.robustnessContribution.partiallyRedundantKeyPathsWithSpecialKey
-            
-            elif redundancyType is RedundancyType.ROBUSTNESS_BOTH:
-                both = self.robustnessContribution.redundantKeyPathsWithSpecialKey
-                both.update( self.robustnessContribution.partiallyRedundantKeyPathsWithSpecialKey )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY:
-                return self.flexibilityContribution.redundantKeyPathsWithSpecialKey
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallyRedundantKeyPathsWithSpecialKey
-            
-            elif redundancyType is RedundancyType.FLEXIBILITY_BOTH:
-                both = self.flexibilityContribution.redundantKeyPathsWithSpecialKey
-                both.update( self.flexibilityContribution.partiallyRedundantKeyPathsWithSpecialKey )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY:
-                return self.flexibilityContribution.targetRedundantKeyPathsWithSpecialKey
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallyTargetRedundantKeyPathsWithSpecialKey
-            
-            elif redundancyType is RedundancyType.TARGET_FLEXIBILITY_BOTH:
-                both = self.flexibilityContribution.targetRedundantKeyPathsWithSpecialKey
-                both.update( self.flexibilityContribution.partiallyTargetRedundantKeyPathsWithSpecialKey )
-                return both
-            
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY:
-                return self.flexibilityContribution.sourceRedundantKeyPathsWithSpecialKey
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_PARTIAL:
-                return self.flexibilityContribution.partiallySourceRedundantKeyPathsWithSpecialKey
-            
-            elif redundancyType is RedundancyType.SOURCE_FLEXIBILITY_BOTH:
-                both = self.flexibilityContribution.sourceRedundantKeyPathsWithSpecialKey
-                both.update( self.flexibilityContribution.partiallySourceRedundantKeyPathsWithSpecialKey )
-                return both
-            
-            
-            else:
-                raise ValueError("This type of redundancy is unknown: " + str(redundancyType))
+        if not self.collectPaths:
+            raise ValueError("When constructing the redundancy contribution object, you chose not to collect paths!")
         
-        except AttributeError:
-            raise ValueError("When constructing the redundancy object, you excluded this type of redundancy!")
+        return _getMergedAttributes(self, _contributedPathsForKeyAttributes, redundancyType, self._bothPathsForKey)
     
     
 
 
 class Comparison():
     
+    __slots__ = ('graphA', 'redundancyA', 'graphB', 'redundancyB', '_keysBoth', '_redundantKeys', '_redundancyKeys')
+    
     def __init__(self, graphA: DirectedMultiGraph, graphB: DirectedMultiGraph):
         """
         Compare redundancy between two graphs.
@@ -2145,6 +2214,10 @@ class Comparison():
         self.redundancyA = Redundancy(graphA)
         self.graphB = graphB
         self.redundancyB = Redundancy(graphB)
+        
+        self._keysBoth = frozenset(graphA.getEdgeKeys()).intersection(graphB.getEdgeKeys()) # FrozenSet[Element] keys of graph A and graph B. The graphs are not expected to change afterwards.
+        self._redundantKeys = dict() # Dict[int, Tuple[FrozenSet[Element], FrozenSet[Element]]] lazily computed redundant keys of graph A and graph B which exist in both graphs, keyed by RedundancyType.index
+        self._redundancyKeys = dict() # Dict[Tuple[int, int], FrozenSet[Element]] lazily computed lost/conserved/added keys, keyed by (RedundancyType.index, direction). Shared by ContributionComparison.
     
     @classmethod
     def fromOrganismGroups(cls, groupA: Organism.Group, groupB: Organism.Group, majorityPercentage = None):
@@ -2241,29 +2314,8 @@ class Comparison():
         return self._getRedundancyRatio(redundancyType, 1)
     
     def _getRedundancyRatio(self, redundancyType: RedundancyType,  direction: int) -> float:
-        keysA = self.graphA.getEdgeKeys()
-        keysB = self.graphB.getEdgeKeys()        
-        keysBoth = keysA.intersection(keysB)
-        
-        redundantKeysA = self.redundancyA.getRedundantKeys(redundancyType)
-        redundantKeysB = self.redundancyB.getRedundantKeys(redundancyType)
-        
-        # find relevant redundant keys
-        relevantKeys = set()
-        for key in keysBoth:
-            if direction == -1: # lost
-                if key in redundantKeysA and not key in redundantKeysB:
-                    relevantKeys.add(key)
-                
-            elif direction == 0: # conserved
-                if key in redundantKeysA and redundantKeysB:
-                    relevantKeys.add(key)
-                    
-            elif direction == 1: # added
-                if key in redundantKeysB and not key in redundantKeysA:
-                    relevantKeys.add(key)
-        
-        return len(relevantKeys)/len(keysBoth)
+        relevantKeys = self._getRedundancyKeys(redundancyType, direction)
+        return len(relevantKeys)/len(self._keysBoth)
     
     
     
@@ -2283,7 +2335,7 @@ class Comparison():
         -------
         Set[Element]
         """
-        self._getRedundancyKeys(redundancyType, -1)
+        return set(self._getRedundancyKeys(redundancyType, -1))
     
     def getConservedRedundancyKeys(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[Element]:
         """
@@ -2301,7 +2353,7 @@ class Comparison():
         -------
         Set[Element]
         """
-        self._getRedundancyKeys(redundancyType, 0)
+        return set(self._getRedundancyKeys(redundancyType, 0))
     
     def getAddedRedundancyKeys(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[Element]:
         """
@@ -2318,31 +2370,64 @@ class Comparison():
         -------
         Set[Element]
         """
-        self._getRedundancyKeys(redundancyType, 1)
+        return set(self._getRedundancyKeys(redundancyType, 1))
+    
+    def getAllRedundancyKeysAndRatios(self, redundancyType: RedundancyType = RedundancyType.default) -> Tuple[Set[Element], Set[Element], Set[Element], float, float, float]:
+        """
+        Get keys which have lost, conserved, and added redundancy from graph A to graph B, and their ratios, in one go.
+        
+        Equal to calling :func:`getLostRedundancyKeys`, :func:`getConservedRedundancyKeys`, :func:`getAddedRedundancyKeys`, and their *Ratio counterparts, but looks up the redundant keys of both graphs only once.
+        
+        Parameters
+        ----------
+        redundancyType : RedundancyType
+            Type of redundancy to use for computation. For target-/source-flexibility, only the paths for target/source nodes are reported, paths of the respective other node are ignored.
+        
+        Returns
+        -------
+        Tuple[Set[Element], Set[Element], Set[Element], float, float, float]
+            Tuple of (lost keys, conserved keys, added keys, lost ratio, conserved ratio, added ratio).
+            If graph A and graph B share no keys at all, all three ratios are 0.0.
+        """
+        redundantKeysA, redundantKeysB = self._getRedundantKeys(redundancyType)
+        sumKeysBoth = len(self._keysBoth) or 1 # no shared keys means no relevant keys either, all ratios are 0.0
         
-    def _getRedundancyKeys(self, redundancyType: RedundancyType, direction: int) -> Set[Element]:
-        keysA = self.graphA.getEdgeKeys()
-        keysB = self.graphB.getEdgeKeys()        
-        keysBoth = keysA.intersection(keysB)
+        lostKeys = set(redundantKeysA - redundantKeysB)
+        conservedKeys = set(redundantKeysA & redundantKeysB)
+        addedKeys = set(redundantKeysB - redundantKeysA)
         
-        redundantKeysA = self.redundancyA.getRedundantKeys(redundancyType)
-        redundantKeysB = self.redundancyB.getRedundantKeys(redundancyType)
+        return (lostKeys, conservedKeys, addedKeys, len(lostKeys)/sumKeysBoth, len(conservedKeys)/sumKeysBoth, len(addedKeys)/sumKeysBoth)
         
-        # find relevant redundant keys
-        relevantKeys = set()
-        for key in keysBoth:
-            if direction == -1: # lost
-                if key in redundantKeysA and not key in redundantKeysB:
-                    relevantKeys.add(key)
-                
-            elif direction == 0: # conserved
-                if key in redundantKeysA and redundantKeysB:
-                    relevantKeys.add(key)
-                    
-            elif direction == 1: # added
-                if key in redundantKeysB and not key in redundantKeysA:
-                    relevantKeys.add(key)
+    def _getRedundantKeys(self, redundancyType: RedundancyType) -> Tuple[FrozenSet[Element], FrozenSet[Element]]:
+        # the redundancy objects do not change, restrict to keys in both graphs only once per type
+        redundantKeys = self._redundantKeys.get(redundancyType.index)
+        if redundantKeys is None:
+            keysBoth = self._keysBoth
+            redundantKeys = (self.redundancyA.getRedundantKeys(redundancyType).intersection(keysBoth), self.redundancyB.getRedundantKeys(redundancyType).intersection(keysBoth))
+            self._redundantKeys[redundancyType.index] = redundantKeys
+        
+        return redundantKeys
+    
+    def _getRedundancyKeys(self, redundancyType: RedundancyType, direction: int) -> FrozenSet[Element]:
+        # single place to find relevant redundant keys, for keys, ratios, and paths. Not copied, because all internal callers only read it.
+        cacheKey = (redundancyType.index, direction)
+        relevantKeys = self._redundancyKeys.get(cacheKey)
+        if relevantKeys is not None:
+            return relevantKeys
+        
+        redundantKeysA, redundantKeysB = self._getRedundantKeys(redundancyType)
         
+        # already restricted to keys in both graphs
+        if direction == -1: # lost
+            relevantKeys = redundantKeysA - redundantKeysB
+        
+        elif direction == 0: # conserved
+            relevantKeys = redundantKeysA & redundantKeysB
+        
+        elif direction == 1: # added
+            relevantKeys = redundantKeysB - redundantKeysA
+        
+        self._redundancyKeys[cacheKey] = relevantKeys
         return relevantKeys
     
     
@@ -2426,11 +2511,9 @@ class Comparison():
                 currentPathsA = pathsA[key]
                 currentPathsB = pathsB[key]
                 
-                currentPathsBoth = currentPathsA.intersection(currentPathsB)
-                currentPathsA.difference_update(currentPathsBoth)
-                currentPathsB.difference_update(currentPathsBoth)
+                currentPathsBoth = currentPathsA & currentPathsB
                 
-                resultPaths[key] = (currentPathsA, currentPathsBoth, currentPathsB)
+                resultPaths[key] = (currentPathsA - currentPathsBoth, currentPathsBoth, currentPathsB - currentPathsBoth)
                 
             else: # lost or added
                 resultPaths[key] = paths[key]
@@ -2439,7 +2522,7 @@ class Comparison():
     
     
     
-    def getLostRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[Path]:
+    def getLostRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[Path]:
         """
         Get all alternative paths which have been lost from graph A to graph B.
         
@@ -2452,12 +2535,12 @@ class Comparison():
         
         Returns
         -------
-        Set[Path]
+        FrozenSet[Path]
             Set of alternative paths which have been lost in graph B.
         """
         return self._getRedundancyPaths(redundancyType, -1)
     
-    def getConservedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[Path]:
+    def getConservedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[Path]:
         """
         Get all alternative paths which have been conserved between graph A and graph B.
         
@@ -2470,12 +2553,12 @@ class Comparison():
         
         Returns
         -------
-        Set[Path]
+        FrozenSet[Path]
             Set of alternative paths which are both in graph A and in graph B.
         """
         return self._getRedundancyPaths(redundancyType, 0)
     
-    def getAddedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[Path]:
+    def getAddedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[Path]:
         """
         Get all alternative paths which have been added from graph A to graph B.
         
@@ -2488,23 +2571,54 @@ class Comparison():
         
         Returns
         -------
-        Set[Path]
+        FrozenSet[Path]
             Set of alternative paths which have been added in graph B.
         """
         return self._getRedundancyPaths(redundancyType, 1)
     
-    def _getRedundancyPaths(self, redundancyType: RedundancyType, direction: int) -> Set[Path]:
-        pathsA = self.redundancyA.getRedundancyPaths(redundancyType)
-        pathsB = self.redundancyB.getRedundancyPaths(redundancyType)
-        
+    def _getRedundancyPaths(self, redundancyType: RedundancyType, direction: int) -> FrozenSet[Path]:
+        # only fetch the other side if the result is not already known to be empty
         if direction == -1: # lost
+            pathsA = self.redundancyA.getRedundancyPaths(redundancyType)
+            if not pathsA:
+                return frozenset()
+            pathsB = self.redundancyB.getRedundancyPaths(redundancyType)
             return pathsA.difference(pathsB)
             
         elif direction == 0: # conserved
+            pathsA = self.redundancyA.getRedundancyPaths(redundancyType)
+            if not pathsA:
+                return frozenset()
+            pathsB = self.redundancyB.getRedundancyPaths(redundancyType)
             return pathsA.intersection(pathsB)
                 
         elif direction == 1: # added
+            pathsB = self.redundancyB.getRedundancyPaths(redundancyType)
+            if not pathsB:
+                return frozenset()
+            pathsA = self.redundancyA.getRedundancyPaths(redundancyType)
             return pathsB.difference(pathsA)
+    
+    def getAllRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Tuple[FrozenSet[Path], FrozenSet[Path], FrozenSet[Path]]:
+        """
+        Get all alternative paths which have been lost, conserved, and added from graph A to graph B, in one go.
+        
+        Equal to calling :func:`getLostRedundancyPaths`, :func:`getConservedRedundancyPaths`, and :func:`getAddedRedundancyPaths`, but fetches the paths of A and B only once.
+        
+        Parameters
+        ----------
+        redundancyType : RedundancyType
+            Type of redundancy to use for computation. For target-/source-flexibility, only the paths for target/source nodes are reported, paths of the respective other node are ignored.
+        
+        Returns
+        -------
+        Tuple[FrozenSet[Path], FrozenSet[Path], FrozenSet[Path]]
+            Tuple of (lost paths, conserved paths, added paths).
+        """
+        pathsA = self.redundancyA.getRedundancyPaths(redundancyType)
+        pathsB = self.redundancyB.getRedundancyPaths(redundancyType)
+        
+        return (pathsA - pathsB, pathsA & pathsB, pathsB - pathsA)
         
     
         
@@ -2514,6 +2628,8 @@ class Comparison():
 
 class ContributionComparison():
     
+    __slots__ = ('comparison', 'redundancyContributionA', 'redundancyContributionB')
+    
     def __init__(self, comparison: Comparison, specialKeysA: Set[Element], specialKeysB: Set[Element]):
         """
         Compare contribution to redundancy between two graphs.
@@ -2600,41 +2716,51 @@ class ContributionComparison():
     def _getRedundancyKeyContributionRatio(self, redundancyType: RedundancyType,  direction: int) -> float:
         redundantKeys = self.comparison._getRedundancyKeys(redundancyType, direction)
         
+        # keys which have a redundancy due to a special key, i.e. have a special key in redundant paths. Only intersect with the keys of the contribution dicts, do not touch their sets.
         if direction == -1: # lost
             specialForRedundantKeyA = self.redundancyContributionA.getContributingSpecialForKey(redundancyType)
+            contributedKeys = redundantKeys.intersection(specialForRedundantKeyA.keys())
             
         elif direction == 0: # conserved
             specialForRedundantKeyA = self.redundancyContributionA.getContributingSpecialForKey(redundancyType)
             specialForRedundantKeyB = self.redundancyContributionB.getContributingSpecialForKey(redundancyType)
+            contributedKeys = redundantKeys.intersection(specialForRedundantKeyA.keys()) | redundantKeys.intersection(specialForRedundantKeyB.keys()) # A or B can have a special key on alternative path of a redundant key, for the key to be reported here. It is **not** necessary, that both A and B have to have such a special key. 
                 
         elif direction == 1: # added
             specialForRedundantKeyB = self.redundancyContributionB.getContributingSpecialForKey(redundancyType)
+            contributedKeys = redundantKeys.intersection(specialForRedundantKeyB.keys())
         
-        contributedKeys = set() # which have a redundancy due to a special key
-        for key in redundantKeys:
-            if direction == -1: # lost
-                specials = specialForRedundantKeyA.get(key, None)
-                
-            elif direction == 0: # conserved
-                specialsA = specialForRedundantKeyA.get(key, None)
-                specialsB = specialForRedundantKeyB.get(key, None)
-                
-                if specialsA is not None:
-                    if specialsB is not None:
-                        specialsA.update( specialsB ) # A or B can have a special key on alternative path of a redundant key, for the key to be reported here. It is **not** necessary, that both A and B have to have such a special key. 
-                        specials = specialsA
-                    else:
-                        specials = specialsA
-                else:
-                    specials = specialsB
-                    
-            elif direction == 1: # added
-                specials = specialForRedundantKeyB.get(key, None)
-            
-            if specials is not None: # has special key in redundant paths
-                contributedKeys.add( key )
+        return 0.0 if len(redundantKeys) == 0 else len(contributedKeys)/len(redundantKeys)
+    
+    def getAllRedundancyKeyContributionRatios(self, redundancyType: RedundancyType = RedundancyType.default) -> Tuple[float, float, float]:
+        """
+        Get ratios of contribution to rendundancy of keys, which have lost, conserved, and added redundancy, in one go.
+        
+        Equal to calling :func:`getLostRedundancyKeyContributionRatio`, :func:`getConservedRedundancyKeyContributionRatio`, and :func:`getAddedRedundancyKeyContributionRatio`,
+        but intersects with the keys contributed to in A and in B only once.
+        
+        Parameters
+        ----------
+        redundancyType : RedundancyType
+            Type of redundancy to use for computation.
+        
+        Returns
+        -------
+        Tuple[float, float, float]
+            Tuple of (lost ratio, conserved ratio, added ratio).
+        """
+        redundantKeysA, redundantKeysB = self.comparison._getRedundantKeys(redundancyType)
         
-        return len(contributedKeys)/len(redundantKeys)
+        # redundant keys in A/B, which have a special key in redundant paths
+        contributedKeysA = redundantKeysA.intersection(self.redundancyContributionA.getContributingSpecialForKey(redundancyType).keys())
+        contributedKeysB = redundantKeysB.intersection(self.redundancyContributionB.getContributingSpecialForKey(redundancyType).keys())
+        
+        ratios = []
+        for direction, contributedKeys in ((-1, contributedKeysA - redundantKeysB), (0, (contributedKeysA | contributedKeysB) & redundantKeysA & redundantKeysB), (1, contributedKeysB - redundantKeysA)):
+            redundantKeys = self.comparison._getRedundancyKeys(redundancyType, direction)
+            ratios.append(0.0 if len(redundantKeys) == 0 else len(contributedKeys)/len(redundantKeys))
+        
+        return tuple(ratios)
     
     
     
@@ -2656,7 +2782,7 @@ class ContributionComparison():
             Sets of key elements, which have lost redundancy from graph A to graph B, and which have a redundant path that contains a special key, keyed by the special key.
             All of these paths (except for maybe one) exist only in A.
         """
-        self._getContributedRedundancyKeyForSpecial(redundancyType, -1)
+        return self._getContributedRedundancyKeyForSpecial(redundancyType, -1)
     
     def getContributedConservedRedundancyKeysForSpecial(self, redundancyType: RedundancyType = RedundancyType.default) -> Dict[Element, Set[Element]]:
         """
@@ -2677,7 +2803,7 @@ class ContributionComparison():
             Sets of key elements, which have conserved redundancy from graph A to graph B, and which have a redundant path that contains a special key, keyed by the special key.
             All of these paths may exist in only A, only B, or in both. One occurence is enough to be reported here.
         """
-        self._getContributedRedundancyKeyForSpecial(redundancyType, 0)
+        return self._getContributedRedundancyKeyForSpecial(redundancyType, 0)
     
     def getContributedAddedRedundancyKeysForSpecial(self, redundancyType: RedundancyType = RedundancyType.default) -> Dict[Element, Set[Element]]:
         """
@@ -2696,58 +2822,37 @@ class ContributionComparison():
             Sets of key elements, which have become redundant from graph A to graph B, and which have a redundant path that contains a special key, keyed by the special key.
             All of these paths (except for maybe one) exist only in B.
         """
-        self._getContributedRedundancyKeyForSpecial(redundancyType, 1)
+        return self._getContributedRedundancyKeyForSpecial(redundancyType, 1)
     
     def _getContributedRedundancyKeyForSpecial(self, redundancyType: RedundancyType,  direction: int) -> Dict[Element, Set[Element]]:
         redundantKeys = self.comparison._getRedundancyKeys(redundancyType, direction)
-        contributedKeysForSpecial = dict() # which have a redundancy due to a special key
         
         if direction == -1: # lost
-            redundantKeyForSpecialA = self.redundancyContributionA.getContributedKeysForSpecial(redundancyType)
-            
-            for special, keys in redundantKeyForSpecialA.items():
-                overlappingKeys = keys.intersection(redundantKeys)
-                
-                if len(overlappingKeys) > 0:
-                    contributedKeysForSpecial[special] = overlappingKeys
+            specialForRedundantKeyDicts = (self.redundancyContributionA.getContributingSpecialForKey(redundancyType), )
             
         elif direction == 0: # conserved
-            redundantKeyForSpecialA = self.redundancyContributionA.getContributedKeysForSpecial(redundancyType)
-            redundantKeyForSpecialB = self.redundancyContributionB.getContributedKeysForSpecial(redundancyType)
-            
-            for special, keys in redundantKeyForSpecialA.items():
-                overlappingKeys = keys.intersection(redundantKeys)
-                
-                if len(overlappingKeys) > 0:
-                    contributedKeysForSpecial[special] = overlappingKeys
-            
-            for special, keys in redundantKeyForSpecialB.items():
-                overlappingKeys = keys.intersection(redundantKeys)
-                
-                if len(overlappingKeys) > 0:
-                    currentSet = contributedKeysForSpecial.get(special, None)
-                    
-                    if currentSet is None:
-                        currentSet = set()
-                        contributedKeysForSpecial[special] = currentSet
-                        
-                    currentSet.update(overlappingKeys)
+            specialForRedundantKeyDicts = (self.redundancyContributionA.getContributingSpecialForKey(redundancyType), self.redundancyContributionB.getContributingSpecialForKey(redundancyType))
                 
         elif direction == 1: # added
-            redundantKeyForSpecialB = self.redundancyContributionB.getContributedKeysForSpecial(redundancyType)
-            
-            for special, keys in redundantKeyForSpecialB.items():
-                overlappingKeys = keys.intersection(redundantKeys)
+            specialForRedundantKeyDicts = (self.redundancyContributionB.getContributingSpecialForKey(redundancyType), )
+        
+        # walk the relevant redundant keys and bucket them by special key, instead of intersecting the keys of every special key
+        contributedKeysForSpecial = defaultdict(set) # which have a redundancy due to a special key
+        for specialForRedundantKey in specialForRedundantKeyDicts:
+            for key in redundantKeys:
+                specials = specialForRedundantKey.get(key, None)
+                if specials is None:
+                    continue
                 
-                if len(overlappingKeys) > 0:
-                    contributedKeysForSpecial[special] = overlappingKeys
+                for special in specials:
+                    contributedKeysForSpecial[special].add(key)
         
-        return contributedKeysForSpecial
+        return dict(contributedKeysForSpecial)
         
     
     
     
-    def getContributedLostRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[MarkedPath]:
+    def getContributedLostRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[MarkedPath]:
         """
         Get all alternative paths which have been lost, and have a special key on them.
         
@@ -2760,12 +2865,12 @@ class ContributionComparison():
         
         Returns
         -------
-        Set[MarkedPath]
+        FrozenSet[MarkedPath]
             Set of alternative paths which have been lost from graph A to graph B.
         """
         return self._getContributedRedundancyPaths(redundancyType, -1)
     
-    def getContributedConservedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[MarkedPath]:
+    def getContributedConservedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[MarkedPath]:
         """
         Get all alternative paths which have been conserved, and have a special key on them.
         
@@ -2778,12 +2883,12 @@ class ContributionComparison():
         
         Returns
         -------
-        Set[MarkedPath]
+        FrozenSet[MarkedPath]
             Set of alternative paths which have been conserved from graph A to graph B.
         """
         return self._getContributedRedundancyPaths(redundancyType, 0)
     
-    def getContributedAddedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Set[MarkedPath]:
+    def getContributedAddedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> FrozenSet[MarkedPath]:
         """
         Get all alternative paths which have become redundant, and have a special key on them.
         
@@ -2796,23 +2901,55 @@ class ContributionComparison():
         
         Returns
         -------
-        Set[MarkedPath]
+        FrozenSet[MarkedPath]
             Set of alternative paths which have become redundant from graph A to graph B.
         """
         return self._getContributedRedundancyPaths(redundancyType, 1)
     
-    def _getContributedRedundancyPaths(self, redundancyType: RedundancyType,  direction: int) -> Set[MarkedPath]:
-        pathsA = self.redundancyContributionA.getContributedPaths(redundancyType)
-        pathsB = self.redundancyContributionB.getContributedPaths(redundancyType)
-        
+    def _getContributedRedundancyPaths(self, redundancyType: RedundancyType,  direction: int) -> FrozenSet[MarkedPath]:
+        # only fetch the other side if the result is not already known to be empty
         if direction == -1: # lost
+            pathsA = self.redundancyContributionA.getContributedPaths(redundancyType)
+            if not pathsA:
+                return frozenset()
+            pathsB = self.redundancyContributionB.getContributedPaths(redundancyType)
             return pathsA.difference(pathsB)
             
         elif direction == 0: # conserved
+            pathsA = self.redundancyContributionA.getContributedPaths(redundancyType)
+            if not pathsA:
+                return frozenset()
+            pathsB = self.redundancyContributionB.getContributedPaths(redundancyType)
             return pathsA.intersection(pathsB)
                 
         elif direction == 1: # added
+            pathsB = self.redundancyContributionB.getContributedPaths(redundancyType)
+            if not pathsB:
+                return frozenset()
+            pathsA = self.redundancyContributionA.getContributedPaths(redundancyType)
             return pathsB.difference(pathsA)
+    
+    def getAllContributedRedundancyPaths(self, redundancyType: RedundancyType = RedundancyType.default) -> Tuple[FrozenSet[MarkedPath], FrozenSet[MarkedPath], FrozenSet[MarkedPath]]:
+        """
+        Get all alternative paths which have been lost, conserved, and added, and have a special key on them, in one go.
+        
+        Equal to calling :func:`getContributedLostRedundancyPaths`, :func:`getContributedConservedRedundancyPaths`, and :func:`getContributedAddedRedundancyPaths`,
+        but fetches the contributed paths of A and B only once.
+        
+        Parameters
+        ----------
+        redundancyType : RedundancyType
+            Type of redundancy to use for computation. For target-/source-flexibility, only the paths for target/source nodes are reported, paths of the respective other node are ignored.
+        
+        Returns
+        -------
+        Tuple[FrozenSet[MarkedPath], FrozenSet[MarkedPath], FrozenSet[MarkedPath]]
+            Tuple of (lost paths, conserved paths, added paths).
+        """
+        pathsA = self.redundancyContributionA.getContributedPaths(redundancyType)
+        pathsB = self.redundancyContributionB.getContributedPaths(redundancyType)
+        
+        return (pathsA.difference(pathsB), pathsA.intersection(pathsB), pathsB.difference(pathsA))
         
         
         
@@ -2895,17 +3032,24 @@ class ContributionComparison():
         for key in redundantKeys:
             
             if direction == 0: # conserved
-                currentPathsA = pathsForKeyA[key]
-                currentPathsB = pathsForKeyB[key]
+                # only keys with a special key on a path of A or B have contributed paths
+                currentPathsA = pathsForKeyA.get(key, None)
+                currentPathsB = pathsForKeyB.get(key, None)
+                if currentPathsA is None and currentPathsB is None:
+                    continue
                 
-                currentPathsBoth = currentPathsA.intersection(currentPathsB)
-                currentPathsA.difference_update(currentPathsBoth)
-                currentPathsB.difference_update(currentPathsBoth)
+                if currentPathsA is None:
+                    currentPathsA = set()
+                if currentPathsB is None:
+                    currentPathsB = set()
                 
-                markedPathsForKey[key] = (currentPathsA, currentPathsBoth, currentPathsB)
+                # do not change the sets of the contribution objects, they are shared
+                markedPathsForKey[key] = (currentPathsA - currentPathsB, currentPathsA & currentPathsB, currentPathsB - currentPathsA)
             
             else: # lost or added
-                markedPathsForKey[key] = pathsForKey[key]
+                currentPaths = pathsForKey.get(key, None)
+                if currentPaths is not None:
+                    markedPathsForKey[key] = currentPaths
         
         return markedPathsForKey
     
\ No newline at end of file
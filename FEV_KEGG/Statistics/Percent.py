@@ -1,3 +1,7 @@
+import functools
+from typing import List
+
+
 def getPercent(x, baseValue):
     """
     Calculate percentage.
@@ -10,9 +14,23 @@ def getPercent(x, baseValue):
     Returns
     -------
     float
-        Percentage of `x` out of `baseValue`, normalised to 100.
+        Percentage of `x` out of `baseValue`, normalised to 100. 0.0, if `baseValue` is 0.
+    """
+    return x/baseValue*100 if baseValue else 0.0
+
+@functools.lru_cache(maxsize=32)
+def _getFormatString(decimalPlaces) -> str:
+    """
+    Build the printf-style format string for `decimalPlaces`, only once for each number of decimal places.
     """
-    return x/baseValue*100
+    return "%2." + str( decimalPlaces ) + "f"
+
+@functools.lru_cache(maxsize=32)
+def _getSentenceFormatString(decimalPlaces) -> str:
+    """
+    Build the :meth:`str.format` template of :func:`getPercentSentence` for `decimalPlaces`, only once for each number of decimal places.
+    """
+    return "{}/{} -> {:2." + str( decimalPlaces ) + "f}%"
 
 def getPercentString(x, baseValue):
     """
@@ -46,7 +64,7 @@ def getPercentStringShort(x, baseValue, decimalPlaces = 1):
     str
         String of result of :func:`getPercent`, shortened to `decimalPlaces` decimal places.
     """
-    return ("%2." + str( decimalPlaces ) + "f") % getPercent(x, baseValue)
+    return _getFormatString(decimalPlaces) % (x/baseValue*100 if baseValue else 0.0)
 
 def getPercentSentence(x, baseValue, decimalPlaces = 1):
     """
@@ -64,7 +82,28 @@ def getPercentSentence(x, baseValue, decimalPlaces = 1):
     str
         String of result of :func:`getPercent`, shortened to `decimalPlaces` decimal places, and put into a complete sentence of the form "`x`/`baseValue` -> result%"", i.e. ``23/42 -> 54.76%``.
     """
-    return str(x) + "/" + str(baseValue) + " -> " + getPercentStringShort(x, baseValue, decimalPlaces) + '%'
+    return _getSentenceFormatString(decimalPlaces).format(x, baseValue, x/baseValue*100 if baseValue else 0.0)
+
+def getPercentSentences(xs, baseValue, decimalPlaces = 1) -> List[str]:
+    """
+    Calculate percentages of several values and return each shortened string within a fancy sentence.
+    
+    Parameters
+    ----------
+    xs : Iterable[float or int]
+    baseValue : float or int
+    decimalPlaces : int, optional
+        The number of decimal places to the right to conserve.
+    
+    Returns
+    -------
+    List[str]
+        Result of :func:`getPercentSentence` for each of `xs`, in order.
+    """
+    formatString = _getSentenceFormatString(decimalPlaces)
+    if not baseValue:
+        return [formatString.format(x, baseValue, 0.0) for x in xs]
+    return [formatString.format(x, baseValue, x/baseValue*100) for x in xs]
 
 def floatToPercentString(x, decimalPlaces = 1):
     """
@@ -82,4 +121,4 @@ def floatToPercentString(x, decimalPlaces = 1):
     str
         String of `x`, shortened to `decimalPlaces` decimal places, concatenated with the '%' sign.
     """
-    return ("%2." + str( decimalPlaces ) + "f") % (x * 100) + '%'
\ No newline at end of file
+    return _getFormatString(decimalPlaces) % (x * 100) + '%'
\ No newline at end of file
@@ -1,5 +1,5 @@
 from builtins import int
-import math
+from typing import Iterable, List
 from FEV_KEGG import settings
 
 
@@ -25,7 +25,33 @@ def getExpectationValue(bitScore: float, searchSequenceLength: int, foundSequenc
     float
         Statistical E-value (expectation value) for the occurence of a match of the same confidence with a totally unrelated, e.g. random, sequence.
     """
-    return numberOfSequencesInDatabase * searchSequenceLength * foundSequenceLength * math.pow(2, -bitScore)
+    return numberOfSequencesInDatabase * searchSequenceLength * foundSequenceLength * 2.0 ** -bitScore # power of a float constant, instead of the generic math.pow()
+
+
+def getExpectationValues(bitScores: Iterable[float], searchSequenceLength: int, foundSequenceLengths: Iterable[int], numberOfSequencesInDatabase: int) -> List[float]:
+    """
+    Returns the E-values of several results of a single query in a sequence database.
+    
+    Equal to calling :func:`getExpectationValue` for each result, but the factors shared by all results are only multiplied once.
+    
+    Parameters
+    ----------
+    bitScores : Iterable[float]
+        Comparison scores, normalised to base 2 (bits), one for each result of the query.
+    searchSequenceLength : int
+        Length of the sequence that was the input of the query.
+    foundSequenceLengths : Iterable[int]
+        Lengths of the sequences that were the results of the query, in the same order as `bitScores`.
+    numberOfSequencesInDatabase : int
+        Count of all sequences that could have potentially be found. See :func:`getExpectationValue`.
+        
+    Returns
+    -------
+    List[float]
+        Statistical E-values (expectation values), in the same order as `bitScores`.
+    """
+    searchSpaceFactor = numberOfSequencesInDatabase * searchSequenceLength
+    return [searchSpaceFactor * foundSequenceLength * 2.0 ** -bitScore for bitScore, foundSequenceLength in zip(bitScores, foundSequenceLengths)]
 
 
 def isMatchSignificant(bitScore: float, searchSequenceLength: int, foundSequenceLength: int, numberOfSequencesInDatabase: int, significanceThreshold: float = settings.defaultEvalue) -> bool:
@@ -54,7 +80,5 @@ def isMatchSignificant(bitScore: float, searchSequenceLength: int, foundSequence
     bool
         Whether a sequence match is significant.
     """
-    if getExpectationValue(bitScore, searchSequenceLength, foundSequenceLength, numberOfSequencesInDatabase) <= significanceThreshold:
-        return True
-    else:
-        return False
\ No newline at end of file
+    # same as getExpectationValue(), inlined to save a function call per match
+    return numberOfSequencesInDatabase * searchSequenceLength * foundSequenceLength * 2.0 ** -bitScore <= significanceThreshold
\ No newline at end of file
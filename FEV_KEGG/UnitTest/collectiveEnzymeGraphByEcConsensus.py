@@ -15,6 +15,10 @@ from FEV_KEGG.KEGG import Organism
 import FEV_KEGG
 
 
+enterobacteriales_organisms_abbreviations = ('eco', 'ses', 'sfl', 'ent', 'esa', 'kpn', 'cko', 'ype', 'spe', 'buc')
+gammaproteobacteria_organisms_abbreviations = ('hin', 'mht', 'xcc', 'vch', 'pae', 'acb', 'son', 'pha', 'amc', 'lpn', 'ftu', 'aha') + enterobacteriales_organisms_abbreviations # extend with the sub-set, because they are also part of the set
+
+
 class Test(unittest.TestCase):
 
 
@@ -22,12 +26,7 @@ class Test(unittest.TestCase):
         
         FEV_KEGG.startProcessPool()
         
-        enterobacteriales_organisms_abbreviations = ['eco', 'ses', 'sfl', 'ent', 'esa', 'kpn', 'cko', 'ype', 'spe', 'buc']
         enterobacteriales_organisms = Organism.Group(organismAbbreviations = enterobacteriales_organisms_abbreviations)
-        
-        enterobacteriales_organisms_abbreviations = ['eco', 'ses', 'sfl', 'ent', 'esa', 'kpn', 'cko', 'ype', 'spe', 'buc']
-        gammaproteobacteria_organisms_abbreviations = ['hin', 'mht', 'xcc', 'vch', 'pae', 'acb', 'son', 'pha', 'amc', 'lpn', 'ftu', 'aha']
-        gammaproteobacteria_organisms_abbreviations.extend(enterobacteriales_organisms_abbreviations) # extend with the sub-set, because they are also part of the set
         gammaproteobacteria_organisms = Organism.Group(organismAbbreviations = gammaproteobacteria_organisms_abbreviations)
         
          
@@ -39,11 +38,7 @@ class Test(unittest.TestCase):
         gammaproteobacteria_EC_set = gammaproteobacteria_EC_graph.getECs()
         only_enterobacteriales_EC_set = enterobacteriales_EC_set.difference(gammaproteobacteria_EC_set)
             
-        output = []
-        for ec in only_enterobacteriales_EC_set:
-            output.append(ec.__str__())
-        
-        result = len(output)
+        result = len(only_enterobacteriales_EC_set)
         print(str(result) + ' results')
         self.assertEqual(result, 87)
      
@@ -57,38 +52,28 @@ class Test(unittest.TestCase):
         enterobacteriales_enzymes = enterobacteriales_enzyme_graph.getEnzymes()
         gammaproteobacteria_enzymes = gammaproteobacteria_enzyme_graph.getEnzymes()
         
-        enterobacteriales_EC_set_2 = set()
-        for enzyme in enterobacteriales_enzymes:
-            ecNumbers = enzyme.ecNumbers
-            enterobacteriales_EC_set_2.update(ecNumbers)
+        enterobacteriales_EC_set_2 = set().union(*(enzyme.ecNumbers for enzyme in enterobacteriales_enzymes))
               
-        gammaproteobacteria_EC_set_2 = set()
-        for enzyme in gammaproteobacteria_enzymes:
-            ecNumbers = enzyme.ecNumbers
-            gammaproteobacteria_EC_set_2.update(ecNumbers)
+        gammaproteobacteria_EC_set_2 = set().union(*(enzyme.ecNumbers for enzyme in gammaproteobacteria_enzymes))
         
         only_enterobacteriales_EC_set_2 = enterobacteriales_EC_set_2.difference(gammaproteobacteria_EC_set_2)
           
-        output = []
-        for ec in only_enterobacteriales_EC_set_2:
-            output.append(ec.__str__())
-            
-        result2 = len(output)
+        result2 = len(only_enterobacteriales_EC_set_2)
         print(str(result2) + ' results')
         self.assertEqual(result2, result)
     
          
          
          
-        output = []
-        for ec in only_enterobacteriales_EC_set_2.symmetric_difference(only_enterobacteriales_EC_set):
-            output.append(ec.__str__())
-        result3 = len(output)
+        differing_EC_set = only_enterobacteriales_EC_set_2.symmetric_difference(only_enterobacteriales_EC_set)
+        result3 = len(differing_EC_set)
         print(str(result3) + ' results')
-        self.assertEqual(result3, 0)
         
-        for ecString in output:
-            print( ecString )
+        # only stringify the differing ECs if there are any to report
+        for ec in differing_EC_set:
+            print( ec.__str__() )
+        
+        self.assertEqual(result3, 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+"""
+A unit test for the comparison of contribution to redundancy between two graphs.
+
+A tiny substance-EC graph A has an alternative path for one EC number, via a special EC number. Graph B lacks this alternative path.
+Hence, the EC number has lost redundancy from A to B, and the special EC number has contributed to it.
+This does not depend on KEGG, the graphs are built by hand.
+"""
+
+import unittest
+
+from FEV_KEGG.Graph.Elements import SubstanceID, EcNumber
+from FEV_KEGG.Graph.SubstanceGraphs import SubstanceEcGraph
+from FEV_KEGG.Robustness.Topology.Redundancy import Comparison, ContributionComparison, RedundancyType
+
+
+class Test(unittest.TestCase):
+
+
+    def test_contributedLostRedundancyKeysForSpecial(self):
+        
+        substance1 = SubstanceID('C00001')
+        substance2 = SubstanceID('C00002')
+        substance3 = SubstanceID('C00003')
+        substance4 = SubstanceID('C00004')
+        
+        redundantEc = EcNumber('1.1.1.1')
+        specialEc = EcNumber('2.2.2.2')
+        otherEc = EcNumber('3.3.3.3')
+        
+        # A: substance1 -> substance2 is also possible via substance3
+        graphA = SubstanceEcGraph()
+        graphA.addEdge(substance1, substance2, redundantEc)
+        graphA.addEdge(substance1, substance3, specialEc)
+        graphA.addEdge(substance3, substance2, otherEc)
+        
+        # B: the alternative path is broken
+        graphB = SubstanceEcGraph()
+        graphB.addEdge(substance1, substance2, redundantEc)
+        graphB.addEdge(substance1, substance3, specialEc)
+        graphB.addEdge(substance4, substance2, otherEc)
+        
+        comparison = Comparison(graphA, graphB)
+        self.assertEqual(comparison.getLostRedundancyKeys(RedundancyType.ROBUSTNESS), {redundantEc})
+        
+        contributionComparison = ContributionComparison(comparison, {specialEc}, {specialEc})
+        
+        result = contributionComparison.getContributedLostRedundancyKeysForSpecial(RedundancyType.ROBUSTNESS)
+        self.assertEqual(result, {specialEc: {redundantEc}})
+        
+        result = contributionComparison.getContributedAddedRedundancyKeysForSpecial(RedundancyType.ROBUSTNESS)
+        self.assertEqual(result, dict())
+
+
+if __name__ == "__main__":
+    
+    unittest.main()
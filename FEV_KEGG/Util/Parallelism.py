@@ -1,3 +1,12 @@
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import types
+
+from FEV_KEGG import settings
+
 def printBelowProgress(message):
     """
     Does a print() beneath any progress bars.
@@ -16,11 +25,17 @@ def printBelowProgress(message):
     There is no check if the possible progress bars are actually rendered.
     Therefore, a surplus of empty lines may appear, or there may not be enough.
     """
-    import FEV_KEGG.settings
-    for _ in range(0, FEV_KEGG.settings.processes + 1):
-        print('')
+    # one write and flush, instead of a print() for each line
+    output = '\n' * (settings.processes + 1)
     if message is not None:
-        print( message )
+        output += str(message) + '\n'
+    sys.stdout.write(output)
+    sys.stdout.flush()
+
+_isMainProcessForPid = (None, None)
+"""
+Cached result of :func:`isMainProcess`, with the ID of the process it was computed in. Forked processes inherit this, hence the ID.
+"""
 
 def isMainProcess():
     """
@@ -31,8 +46,16 @@ def isMainProcess():
     bool
         *True* if this is the main process (any thread), *False* if not.
     """
-    import multiprocessing
-    return not type(multiprocessing.current_process()) == multiprocessing.Process
+    global _isMainProcessForPid
+    pid = os.getpid()
+    cachedPid, isMain = _isMainProcessForPid
+    if cachedPid != pid:
+        # Pool workers are of type ForkProcess or SpawnProcess, so their type does not tell. Spawned workers import FEV_KEGG before their parent process is known, but after their name has been set.
+        # While a spawned worker or the forkserver re-imports the main module, the process is still '_inheriting'.
+        currentProcess = multiprocessing.current_process()
+        isMain = multiprocessing.parent_process() is None and currentProcess.name == 'MainProcess' and not getattr(currentProcess, '_inheriting', False)
+        _isMainProcessForPid = (pid, isMain)
+    return isMain
 
 def isMainThread():
     """
@@ -43,7 +66,6 @@ def isMainThread():
     bool
         *True* if this is the main thread (of any process), *False* if not.
     """
-    import threading
     return threading.current_thread() is threading.main_thread()
 
 def isMainThreadInMainProcess():
@@ -89,51 +111,78 @@ def keyboardInterruptHandler(processPoolFutures = None, threadPool = None, threa
     Keep in mind that this queue is **always** populated with *p* + 1 tasks, while *p* (different) tasks are being executed, with *p* being the number of processes in the pool.
     However, this only works as long as :class:`ProcessPoolExecutor` does **not** re-create broken processes!
     """
-    import sys
+    # only the first of concurrent calls cancels, the others would only contend for the same pools' locks
+    if not _cancelInProgress.acquire(blocking = False):
+        return
     
-    # tell running threads to cancel. Including the ones in a thread pool's call_queue.
-    if terminateProcess is True or threadPool is not None:
-        enableShallCancelThreads()
+    try:
+        # tell running threads to cancel. Including the ones in a thread pool's call_queue.
+        if terminateProcess is True or threadPool is not None:
+            enableShallCancelThreads()
     
-    # tell futures scheduled in sub-processes to cancel
-    if isMainProcess():
-        if silent is False:
-            printBelowProgress( 'Program interrupted by keyboard. Exiting, please wait...' )
-            print( 'Grinding processes to a halt...' )
+        # tell futures scheduled in sub-processes to cancel
+        if isMainProcess():
+            if silent is False:
+                printBelowProgress( 'Program interrupted by keyboard. Exiting, please wait...' )
+                print( 'Grinding processes to a halt...' )
         
-        # cancel futures. This does NOT include futures already scheduled in the process' call_queue! Which are always n+1 (n = number of processes) futures.
-        if processPoolFutures is not None:
-            for future in processPoolFutures:
-                future.cancel()
-        
-        # tell the pool to shut down. This does NOT stop already scheduled futures to cancel or even abort! Pending futures are canceled above. Running futures (and futures already inside the call_queue) can NOT be aborted through the current API.
-        global processPool
-        if processPool is not None:
-            processPool.shutdown(wait = not silent)
+            # cancel futures and tell the pool to shut down. This does NOT include futures already scheduled in the process' call_queue! Which are always n+1 (n = number of processes) futures.
+            # Running futures (and futures already inside the call_queue) can NOT be aborted through the current API.
+            global processPool
+            if processPool is not None:
+                _shutdownCancellingFutures(processPool, processPoolFutures, wait = not silent)
+            elif processPoolFutures is not None:
+                for future in processPoolFutures:
+                    future.cancel()
         
-        # Running futures (and futures already inside the call_queue) can NOT be cancelled. The only way is to terminate all processes of the pool, see sys.exit() below.
+            # Running futures (and futures already inside the call_queue) can NOT be cancelled. The only way is to terminate all processes of the pool, see sys.exit() below.
     
-    # tell scheduled threads to cancel
-    if threadPool is not None:
-        if silent is False: 
-            print( 'Knotting together loose threads...' )
+        # tell scheduled threads to cancel
+        if threadPool is not None:
+            if silent is False: 
+                print( 'Knotting together loose threads...' )
         
-        if threadPoolFutures is not None:
-            for future in threadPoolFutures:
-                future.cancel()
-                
-        threadPool.shutdown(wait = True)
+            _shutdownCancellingFutures(threadPool, threadPoolFutures, wait = True)
         
-        # reset shallCancel signal, so next work item can function correctly
-        if terminateProcess is False:
-            resetShallCancelThreads()
-    
-    # terminate process. This allows to cancel futures already inside the call_queue of the pool. Only works because, currently, the pool does not re-create broken processes.
-    if terminateProcess is True:
-        if silent is True:
-            sys.exit()
-        else:
-            sys.exit('Done. SNAFU')
+            # reset shallCancel signal, so next work item can function correctly
+            if terminateProcess is False:
+                resetShallCancelThreads()
+    
+        # terminate process. This allows to cancel futures already inside the call_queue of the pool. Only works because, currently, the pool does not re-create broken processes.
+        if terminateProcess is True:
+            if silent is True:
+                sys.exit()
+            else:
+                sys.exit('Done. SNAFU')
+    finally:
+        _cancelInProgress.release()
+
+_cancelInProgress = threading.Lock()
+"""
+Held while :func:`keyboardInterruptHandler` is cancelling, so that concurrent calls return immediately.
+"""
+    
+def _shutdownCancellingFutures(pool, futures, wait):
+    """
+    Shut down `pool`, cancelling its pending futures first.
+    
+    Parameters
+    ----------
+    pool : concurrent.futures.Executor
+        The pool to shut down.
+    futures : Iterable, optional
+        The :class:`Future` scheduled in `pool`. Only cancelled one by one if the pool can not do it by itself.
+    wait : bool
+        Passed on to :meth:`concurrent.futures.Executor.shutdown`.
+    """
+    try:
+        # since Python 3.9, the pool cancels all its pending futures, even those not listed in `futures`
+        pool.shutdown(wait = wait, cancel_futures = True)
+    except TypeError:
+        if futures is not None:
+            for future in futures:
+                future.cancel()
+        pool.shutdown(wait = wait)
     
 def getNumberOfThreadsDownload(isSSDB = False):
     """
@@ -151,17 +200,16 @@ def getNumberOfThreadsDownload(isSSDB = False):
     int
         The number of allowed threads for downloading.
     """
-    import FEV_KEGG.settings
     if isMainProcess():
         if isSSDB:
-            return FEV_KEGG.settings.downloadThreadsSSDB
+            return settings.downloadThreadsSSDB
         else:
-            return FEV_KEGG.settings.downloadThreads
+            return settings.downloadThreads
     else:
         if isSSDB:
-            return FEV_KEGG.settings.downloadThreadsPerProcessSSDB
+            return settings.downloadThreadsPerProcessSSDB
         else:
-            return FEV_KEGG.settings.downloadThreadsPerProcess
+            return settings.downloadThreadsPerProcess
     
 def getNumberOfThreadsFile():
     """
@@ -174,11 +222,10 @@ def getNumberOfThreadsFile():
     int
         The number of allowed threads for file access.
     """
-    import FEV_KEGG.settings
     if isMainProcess():
-        return FEV_KEGG.settings.fileThreads
+        return settings.fileThreads
     else:
-        return FEV_KEGG.settings.fileThreadsPerProcess
+        return settings.fileThreadsPerProcess
 
 def getTqdmPosition():
     """
@@ -196,16 +243,29 @@ def getTqdmPosition():
     This function depends on the naming of processes of your OS!
     You might have to replace this function to get clean positioning of progress bars.
     """
-    if not isMainProcess():
-        import multiprocessing
-        import re
-        try:
-            position = int( re.sub('^.+-(?=[0-9]+$)', '', multiprocessing.current_process().name) )
-            return position
-        except Exception:
-            return 1 
-    else:
-        return 0
+    global _tqdmPositionForPid
+    pid = os.getpid()
+    cachedPid, position = _tqdmPositionForPid
+    if cachedPid != pid:
+        if not isMainProcess():
+            try:
+                position = int( _processNamePrefixPattern.sub('', multiprocessing.current_process().name) )
+            except Exception:
+                position = 1 
+        else:
+            position = 0
+        _tqdmPositionForPid = (pid, position)
+    return position
+
+_processNamePrefixPattern = re.compile('^.+-(?=[0-9]+$)')
+"""
+Everything in a process' name before its trailing number, see :func:`getTqdmPosition`.
+"""
+
+_tqdmPositionForPid = (None, None)
+"""
+Cached result of :func:`getTqdmPosition`, with the ID of the process it was computed in. Forked processes inherit this, hence the ID.
+"""
 
 processPool = None
 """
@@ -237,21 +297,31 @@ def startProcessPool():
     if isMainThreadInMainProcess() is True and processPool is None:
     
         # create process pool at start. Prevents forking a heavy process.
-        from FEV_KEGG.settings import processes
         import FEV_KEGG.lib.Python.concurrent.futures
         # InterruptibleProcessPoolExecutor ovverides the process worker function of concurrent.futures.ProcessPoolExecutor, keeping a KeyboardInterrupt during queue-pull from causing a stack trace print
-        processPool = FEV_KEGG.lib.Python.concurrent.futures.InterruptibleProcessPoolExecutor( processes )
+        if settings.processPoolStartMethod is None:
+            processPool = FEV_KEGG.lib.Python.concurrent.futures.InterruptibleProcessPoolExecutor( settings.processes )
+        else:
+            processPool = FEV_KEGG.lib.Python.concurrent.futures.InterruptibleProcessPoolExecutor( settings.processes, mp_context = multiprocessing.get_context(settings.processPoolStartMethod) )
         
         # terminate process pool on exit. Frees resources.
         import atexit
-        atexit.register(lambda x: x.shutdown(wait = False), processPool)    
+        atexit.register(_shutdownProcessPoolAtExit)
+
+def _shutdownProcessPoolAtExit():
+    """
+    Shut down the global :attr:`processPool`, if any, without waiting. Cancels its pending futures.
+    """
+    if processPool is not None:
+        _shutdownCancellingFutures(processPool, None, wait = False)
 
 
-shallCancelThreads = False
+_shallCancelThreads = threading.Event()
 """
 Allows threads to be canceled in a timely manner, across the whole process.
 
-Specifically, any task currently running in a thread of this process can check this variable to see whether it is supposed to abort and return early.
+Specifically, any task currently running in a thread of this process can check this event to see whether it is supposed to abort and return early.
+Read and set it via :func:`getShallCancelThreads`, :func:`enableShallCancelThreads`, and :func:`resetShallCancelThreads`, or the module attribute :attr:`shallCancelThreads`.
 
 Note
 ----
@@ -262,15 +332,13 @@ def resetShallCancelThreads():
     """
     Reset the global flag for cancelling all threads to "not cancelling".
     """
-    global shallCancelThreads
-    shallCancelThreads = False
+    _shallCancelThreads.clear()
 
 def enableShallCancelThreads():
     """
     Set the global flag for cancelling all threads to "cancelling".
     """
-    global shallCancelThreads
-    shallCancelThreads = True
+    _shallCancelThreads.set()
 
 def getShallCancelThreads():
     """
@@ -281,5 +349,26 @@ def getShallCancelThreads():
     bool
         Whether all tasks currently running in threads of this process shall abort and return early.
     """
-    global shallCancelThreads
-    return shallCancelThreads
\ No newline at end of file
+    return _shallCancelThreads.is_set()
+
+
+class _ParallelismModule(types.ModuleType):
+    """
+    Type of this module, only to keep :attr:`shallCancelThreads` a plain, settable module attribute backed by :attr:`_shallCancelThreads`.
+    """
+    
+    @property
+    def shallCancelThreads(self):
+        """
+        The global flag for cancelling all threads, as a bool. Setting it to *True* or *False* is equal to :func:`enableShallCancelThreads` or :func:`resetShallCancelThreads`.
+        """
+        return _shallCancelThreads.is_set()
+    
+    @shallCancelThreads.setter
+    def shallCancelThreads(self, value):
+        if value:
+            _shallCancelThreads.set()
+        else:
+            _shallCancelThreads.clear()
+
+sys.modules[__name__].__class__ = _ParallelismModule
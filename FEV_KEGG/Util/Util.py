@@ -1,4 +1,7 @@
 from typing import List, Tuple, Dict
+from collections import defaultdict
+import itertools
+from operator import itemgetter
 
 def deduplicateList(anyList: List, preserveOrder = False):
     """
@@ -25,16 +28,14 @@ def deduplicateList(anyList: List, preserveOrder = False):
     
 
 def _deduplicateListNonPreserving(anyList: List):
-    keys = {}
-    for e in anyList:
-        keys[e] = 1
-    return list( keys.keys() )
+    return list( set(anyList) )
 
 
 def _deduplicateListPreserving(seq: List, idfun=None):
     # order preserving
     if idfun is None:
-        def idfun(x): return x
+        # dicts keep insertion order
+        return list( dict.fromkeys(seq) )
     seen = {}
     result = []
     for item in seq:
@@ -52,6 +53,8 @@ def chunks(iterable, chunk_size):
     """
     Chops Iterable into chunks.
     
+    Consumes `iterable` lazily, only holding one chunk in memory at a time.
+    
     Parameters
     ----------
     iterable : Iterable
@@ -61,47 +64,64 @@ def chunks(iterable, chunk_size):
     
     Yields
     -------
-    Iterable
-        Iterable of the same type as `iterable`, but with length `chunk_size`. Except for the last, of course.
+    List
+        List of the next elements of `iterable`, with length `chunk_size`. Except for the last, of course.
     """
-    iterable = list(iterable)
-    for i in range(0, len(iterable), chunk_size):
-        yield iterable[i:i + chunk_size]
+    iterator = iter(iterable)
+    while True:
+        chunk = list( itertools.islice(iterator, chunk_size) )
+        if not chunk:
+            return
+        yield chunk
 
 
 def prettySortDict(dictionary, byValueFirst = False) -> List[Tuple]:
     
-    sortedValues = dict()
-    for key, value in dictionary.items():
-        sortedValues[key] = sorted(value)
+    sortedValues = {key: sorted(value) for key, value in dictionary.items()}
     
+    # one sort by a composite key, equal to sorting by the secondary and then, stable, by the primary criterion
     if byValueFirst:
-        anonymousFunctionA = lambda item: item[0]
-        anonymousFunctionB = lambda item: item[1]
+        sortKey = itemgetter(1, 0)
                 
     else:
-        anonymousFunctionA = lambda item: item[1]
-        anonymousFunctionB = lambda item: item[0]
+        sortKey = itemgetter(0, 1)
     
-    preSortedDict = sorted(sortedValues.items(), key=anonymousFunctionA)
-    sortedList = sorted(preSortedDict, key=anonymousFunctionB)
+    sortedList = sorted(sortedValues.items(), key=sortKey)
     
     return sortedList
 
 
 def inverseDictKeepingAllKeys(dictionary) -> Dict:
     
-    inversed = {}
+    inversed = defaultdict(set)
     for key, value in dictionary.items():
-        currentSet = inversed.get(value, None)
-        
-        if currentSet is None:
-            currentSet = set()
-            inversed[value] = currentSet
-        
-        currentSet.add( key )
+        inversed[value].add( key )
+    
+    return dict(inversed)
+
+
+def inverseDictOfSets(dictionary) -> Dict:
+    """
+    Inverse a dictionary of collections, grouping the keys by each element of their values.
+    
+    For example, {a: {x, y}, b: {y}} becomes {x: {a}, y: {a, b}}.
+    
+    Parameters
+    ----------
+    dictionary : Dict[Any, Iterable]
+        Dictionary with collections as values. The elements of those collections have to be hashable.
+    
+    Returns
+    -------
+    Dict[Any, Set]
+        A new plain dictionary, each element of any value pointing to the set of keys whose value contained it.
+    """
+    inversed = defaultdict(set)
+    for key, values in dictionary.items():
+        for value in values:
+            inversed[value].add(key)
     
-    return inversed
+    return dict(inversed)
 
 
 def updateDictUpdatingValue(dictA, dictB):
@@ -113,68 +133,59 @@ def updateDictUpdatingValue(dictA, dictB):
     Only works if dictA's values have an update() function, e.g. are sets!
     """
     for key, value in dictB.items():
+        existingValue = dictA.get(key, None)
         
-        if dictA.get(key, None) is None: # does not exist in A, yet. Copy!
+        if existingValue is None: # does not exist in A, yet. Copy!
             dictA[key] = value
             
         else: # already exists in A. Update!
-            dictA[key].update(value)
+            existingValue.update(value)
     
     return dictA
 
 
 def dictToHtml(dictionary, byValueFirst = False, addEcDescriptions = False, headingDescriptionForHeading = None) -> str:
     
+    return ''.join( _dictToHtmlParts(dictionary, byValueFirst, addEcDescriptions, headingDescriptionForHeading) )
+
+
+def _dictToHtmlParts(dictionary, byValueFirst, addEcDescriptions, headingDescriptionForHeading):
+    """
+    Generates the HTML of :func:`dictToHtml` piece by piece, so it can be written to a file without ever holding the whole document in memory.
+    """
     if addEcDescriptions is not False:        
         from FEV_KEGG.Graph.Elements import EcNumber
         EcNumber.addEcDescriptions(addEcDescriptions)
     
     sortedList = prettySortDict(dictionary, byValueFirst)
     
-    from yattag import Doc
-    doc, tag, _ = Doc().tagtext()
+    yield '<html>'
     
-    with tag('html'):
-        
-        # remove underline from links
-        with tag('head'):
-            doc.asis('<style type="text/css">a {text-decoration:none;}</style>')
+    # remove underline from links
+    yield '<head><style type="text/css">a {text-decoration:none;}</style></head>'
+    
+    yield '<body>'
+    
+    for heading, rows in sortedList:
         
-        with tag('body'):
+        yield '<p><table>' + heading.toHtml() + '</table>'
+            
+        if headingDescriptionForHeading is not None:
+            headingDescription = headingDescriptionForHeading.get(heading, None)
             
-            for heading, rows in sortedList:
+            if headingDescription is not None:
+                yield '<table><tr><td>{</td></tr>'
                 
-                with tag('p'):
-                    with tag('table'):
-                        doc.asis(heading.toHtml())
-                        
-                    if headingDescriptionForHeading is not None:
-                        headingDescription = headingDescriptionForHeading.get(heading, None)
-                        
-                        if headingDescription is not None:
-                            with tag('table'):
-                                with tag('tr'):
-                                    with tag('td'):
-                                        doc.asis('{')
-                                
-                                for line in headingDescription:
-                                    with tag('tr'):
-                                        doc.asis(line.toHtml(short = True))
-                                        
-                                with tag('tr'):
-                                    with tag('td'):
-                                        doc.asis('}')
-                    
-                    with tag('table'):
-                        
-                        for row in rows:
-                            with tag('tr'):
-                                doc.asis(row.toHtml(short = True))
-                                
-                with tag('br'):
-                    pass
-                            
-    return doc.getvalue()
+                # rows are plain strings, saves a tag context per row
+                yield ''.join('<tr>' + line.toHtml(short = True) + '</tr>' for line in headingDescription)
+                
+                yield '<tr><td>}</td></tr></table>'
+        
+        yield '<table>' + ''.join('<tr>' + row.toHtml(short = True) + '</tr>' for row in rows) + '</table>'
+        
+        yield '</p><br></br>'
+    
+    yield '</body></html>'
     
     
 def dictToHtmlFile(dictionary, file, byValueFirst = False, inCacheFolder = False, addEcDescriptions = False, headingDescriptionForHeading = None):
@@ -191,8 +202,6 @@ def dictToHtmlFile(dictionary, file, byValueFirst = False, inCacheFolder = False
     from FEV_KEGG import settings
     from FEV_KEGG.KEGG import File
     
-    htmlString = dictToHtml(dictionary, byValueFirst, addEcDescriptions, headingDescriptionForHeading)
-    
     if not file.endswith('.html'):
         file += '.html'
     
@@ -203,5 +212,6 @@ def dictToHtmlFile(dictionary, file, byValueFirst = False, inCacheFolder = False
     if not os.path.isdir(dirName) and dirName != '':
         os.makedirs(os.path.dirname(file))
     
-    File.writeToFile(htmlString, file)
+    # write each heading's table as soon as it is rendered, instead of building the whole HTML string first
+    File.writeToFileIncrementally(_dictToHtmlParts(dictionary, byValueFirst, addEcDescriptions, headingDescriptionForHeading), file)
         
\ No newline at end of file
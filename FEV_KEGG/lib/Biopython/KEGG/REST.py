@@ -27,8 +27,13 @@ Nucleic Acids Res. 28, 29-34 (2000).
 
 """
 # Bio._py3k import BEGIN
-from urllib.request import urlopen as _urlopen
 import io
+import http.client
+import os
+import socket
+import threading
+import urllib.error
+import urllib.parse
 
 def _binary_to_string_handle(handle):
     """Treat a binary (bytes) handle like a text (unicode) handle."""
@@ -41,8 +46,105 @@ def _binary_to_string_handle(handle):
     return wrapped
 # Bio._py3k import END
 
+_connections = threading.local()
+# errors of a reused connection, which the server has closed while it was idle
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 10  # like urllib.request.HTTPRedirectHandler
+
+
+def _new_connection(scheme, netloc, timeout):
+    if scheme == "https":
+        return http.client.HTTPSConnection(netloc, timeout=timeout)
+    return http.client.HTTPConnection(netloc, timeout=timeout)
+
+
+def _get_keep_alive(url, timeout):
+    """GET `url` on this thread's persistent connection to its host.
+
+    Returns the response and its whole body.
+    """
+    split_url = urllib.parse.urlsplit(url)
+    host = (split_url.scheme, split_url.netloc)
+    path = split_url.path or "/"
+    if split_url.query:
+        path += "?" + split_url.query
+
+    # forked processes inherit the connections of the forking thread, never share their sockets
+    pid = os.getpid()
+    if getattr(_connections, "pid", None) != pid:
+        _connections.pid = pid
+        _connections.by_host = {}
+    connections = _connections.by_host
+
+    connection = connections.get(host)
+    if connection is not None and connection.timeout != timeout:
+        connection.close()
+        connection = None
+    is_reused = connection is not None
+
+    while True:
+        if connection is None:
+            connection = _new_connection(split_url.scheme, split_url.netloc, timeout)
+            connections[host] = connection
+        try:
+            connection.request("GET", path, headers={"Connection": "keep-alive"})
+            resp = connection.getresponse()
+            body = resp.read()
+            break
+        except (http.client.HTTPException, OSError) as error:
+            connection.close()
+            del connections[host]
+            connection = None
+            if is_reused and isinstance(error, _STALE_CONNECTION_ERRORS):
+                # the server closed the idle connection, try once more with a fresh one
+                is_reused = False
+                continue
+            # anything else, especially a timeout, is not retried here, that is up to the caller
+            raise urllib.error.URLError(error)
+
+    if resp.will_close:
+        connection.close()
+        del connections[host]
+
+    return resp, body
+
+
+def urlopen_keep_alive(url, timeout=None):
+    """Open `url` like urlopen, but re-use one connection per thread and host.
+
+    Each thread keeps its own persistent HTTP/1.1 connection to every host it
+    talks to, saving the TCP (and TLS) handshake of every further request.
+    The whole body is read before returning, so that the connection is free
+    for the next request, and returned as a binary file-like object (BytesIO)
+    with the final URL as its `url` attribute.
+
+    HTTP error status codes raise urllib.error.HTTPError, connection errors
+    raise urllib.error.URLError, both just like urlopen. Redirects are
+    followed, again on a persistent connection to the host redirected to.
+    """
+    if timeout is None:
+        timeout = socket.getdefaulttimeout()
+
+    for _ in range(_MAX_REDIRECTS + 1):
+        resp, body = _get_keep_alive(url, timeout)
+        location = resp.getheader("Location")
+        if resp.status not in _REDIRECT_STATUSES or location is None:
+            break
+        url = urllib.parse.urljoin(url, location)
+    else:
+        raise urllib.error.HTTPError(url, resp.status, "Too many redirects", resp.msg, io.BytesIO(body))
+
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.msg, io.BytesIO(body))
+
+    handle = io.BytesIO(body)
+    handle.url = url
+    return handle
+
+
 def _q(op, arg1, arg2=None, arg3=None, timeout=None):
-    URL = "http://rest.kegg.jp/%s"
+    URL = "https://rest.kegg.jp/%s"
     if arg2 and arg3:
         args = "%s/%s/%s/%s" % (op, arg1, arg2, arg3)
     elif arg2:
@@ -50,12 +152,10 @@ def _q(op, arg1, arg2=None, arg3=None, timeout=None):
     else:
         args = "%s/%s" % (op, arg1)
     
-    if timeout is not None:
-        resp = _urlopen(URL % (args), timeout=timeout)
-    else:
-        resp = _urlopen(URL % (args))
+    resp = urlopen_keep_alive(URL % (args), timeout=timeout)
 
     if "image" == arg2:
+        # binary BytesIO, see urlopen_keep_alive
         return resp
 
     return _binary_to_string_handle(resp)
@@ -188,7 +288,8 @@ def kegg_get(dbentries, option=None, timeout=None):
     The input is limited to one pathway entry with the image or kgml option.
     The input is limited to one compound/glycan/drug entry with the image option.
 
-    Returns a handle.
+    Returns a handle. With the image option, this is a binary io.BytesIO
+    holding the whole image, not an HTTP response object.
     """
     if isinstance(dbentries, list) and len(dbentries) <= 10:
         dbentries = "+".join(dbentries)
@@ -3,17 +3,21 @@ from concurrent.futures.process import _ResultItem, os
 import sys
 import traceback
 
-def process_worker(call_queue, result_queue):
+def process_worker(call_queue, result_queue, initializer=None, initargs=(), *_):
     """
     A copy of Python's process_worker function in :class:`concurrent.futures.ProcessPoolExecutor`.
     
     This copy was changed to not die on KeyboardInterrupt, but to exit gracefully.
     Also, no traceback is printed upon :class:`NoKnownPathwaysError` or :class:`CancelledError`.
+    Accepts the `initializer` and `initargs` of :class:`concurrent.futures.ProcessPoolExecutor`, ignoring any further arguments of later versions.
     
     Note
     ----
     Copyright © 2001-2018 Python Software Foundation; All Rights Reserved
     """
+    if initializer is not None:
+        initializer(*initargs)
+    
     while True:
         try:
             call_item = call_queue.get(block=True)
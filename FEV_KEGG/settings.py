@@ -59,15 +59,15 @@ Verbosity of the output on the console.
 """
 
 
-import multiprocessing
+import os
 try:
-    processes = int( multiprocessing.cpu_count() )
-except NotImplementedError:
-    processes = 1
+    processes = len( os.sched_getaffinity(0) ) # only the cores this process may run on, e.g. restricted by taskset or a cgroup cpuset
+except AttributeError: # not available on this OS
+    processes = os.cpu_count() or 1
     """
     Number of processes to calculate with.
     
-    Depends on your computer. Defaults to the number of logical CPU cores, or if unretrievable, to 1.
+    Depends on your computer. Defaults to the number of logical CPU cores this process is allowed to run on, or if unretrievable, to 1.
     
     Warnings
     --------
@@ -100,7 +100,27 @@ See Also
 FEV_KEGG.Util.Parallelism.startProcessPool : Spins up a pool of processes. No further setup required.
 """
 
-import math
+processPoolStartMethod = None
+"""
+Start method for the processes of the process pool, e.g. 'forkserver' or 'spawn'. See :func:`multiprocessing.get_context`.
+
+If *None*, uses the default of your OS, which is 'fork' on Linux. Each forked process is a copy of the main process at the time the process pool first receives work, including all the RAM it occupied by then.
+With 'forkserver' or 'spawn', the processes start from a fresh interpreter instead and only load what their tasks need, which saves a lot of RAM if your main process is big, e.g. after fetching the collective metabolism of a large clade.
+
+Warnings
+--------
+With 'forkserver' or 'spawn', the processes import FEV_KEGG themselves, so they do **not** see changes to these settings made at runtime in your main process, e.g. a different :attr:`cachePath`!
+
+Note
+----
+The process pool is created when FEV_KEGG is imported, see :attr:`automaticallyStartProcessPool`. To use a different start method, set this, then shut down and replace the pool before submitting any work::
+
+    FEV_KEGG.settings.processPoolStartMethod = 'forkserver'
+    FEV_KEGG.Util.Parallelism.processPool.shutdown()
+    FEV_KEGG.Util.Parallelism.processPool = None
+    FEV_KEGG.startProcessPool()
+"""
+
 downloadThreads = 32 # in main process, default: 64
 """
 Number of threads to download with at once.
@@ -125,14 +145,14 @@ Warnings
 Should only be used inside the main process. Else, the total number of download threads will multiply by the number of available processors!
 """
 
-downloadThreadsPerProcess = math.floor( downloadThreads / processes ) # in sub-processes
+downloadThreadsPerProcess = downloadThreads // processes # in sub-processes
 """
 Number of threads to download with at once, divided by the number of available processors.
 
 Should be used inside background processes. Depends on your computer.
 """
 
-downloadThreadsPerProcessSSDB = math.floor( downloadThreadsSSDB / processes ) # in sub-processes
+downloadThreadsPerProcessSSDB = downloadThreadsSSDB // processes # in sub-processes
 """
 Number of threads to download with at once from KEGG SSDB, divided by the number of available processors.
 
@@ -149,7 +169,7 @@ Warnings
 --------
 Should only be used inside the main process. Else, the total number of file threads will multiply by the number of available processors!
 """
-fileThreadsPerProcess = math.floor( fileThreads / processes ) # in sub-processes
+fileThreadsPerProcess = fileThreads // processes # in sub-processes
 """
 Number of threads to acces files with at once, divided by the number of available processors.
 
@@ -165,13 +185,6 @@ Time in seconds after which a blocking socket is considered failed.
 Should be well below `retryDownloadMax`, or else you will not retry at all.
 """
 
-downloadTimeoutSocket = math.floor(downloadTimeout / 2)
-"""
-Quirks for `downloadTimeout` in Python 3.4 (and maybe above).
-
-For some reason, in Python 3.4, sockets double the timeout value passed to them.
-"""
-
 retryDownloadMax = 60000 # default: 60000
 """
 Maximum total time in milliseconds a download should be retried before giving up.
@@ -188,6 +201,20 @@ Factor in milliseconds for exponential backoff.
 The backoff function waits ``2^x * retryDownloadBackoffFactor`` milliseconds between retries, where *x* is the count of tries already failed.
 """
 
+retryDownloadBackoffFactorSSDB = 2000 # default: 2000
+"""
+Factor in milliseconds for exponential backoff, when downloading from KEGG SSDB.
+
+Larger than `retryDownloadBackoffFactor`, because SSDB can withstand far fewer parallel connections, see `downloadThreadsSSDB`.
+"""
+
+retryDownloadBackoffJitter = 1000 # default: 1000
+"""
+Maximum random time in milliseconds added to each wait between retries.
+
+Keeps parallel download threads, which failed on the same hiccup of KEGG, from retrying all at the same moment and causing the next failure.
+"""
+
 retryDownloadBackoffMax = 10000 # default: 10000
 """
 Maximum time between two retries, which the exponential backoff function can not exceed.
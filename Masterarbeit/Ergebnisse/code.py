@@ -1,3 +1,5 @@
+import sys
+from collections import defaultdict
 from FEV_KEGG.KEGG.File import cache
 from FEV_KEGG.Evolution.Clade import Clade
 from FEV_KEGG.Statistics import Percent
@@ -42,23 +44,18 @@ if __name__ == '__main__':
     cladeNeofunctionalisationsForFunctionChange = clade.neofunctionalisationsForFunctionChange(majorityPercentageCoreMetabolism, majorityPercentageNeofunctionalisation, eValue=eValue)
     
     #- calculate redundancy
-    cladeRedundancy = Redundancy(cladeEcGraph)
+    cladeRedundancy = Redundancy(cladeEcGraph, onlyType=redundancyType) # flexibility is never reported, do not calculate it
     cladeRedundancyContribution = RedundancyContribution(cladeRedundancy, cladeNeofunctionalisedMetabolismSet)
         
     cladeRobustnessContributedECsForContributingNeofunctionalisedEC = cladeRedundancyContribution.getContributedKeysForSpecial(redundancyType)
     cladeRobustnessContributingNeofunctionalisedECs = set(cladeRobustnessContributedECsForContributingNeofunctionalisedEC.keys())
     
     #- export graph of core metabolism, colouring the edges of (contributing) neofunctionalised ECs
-    edgesOfNeofunctionalisedECs = set()
-    for key in cladeNeofunctionalisedMetabolismSet:
-        for edge in cladeEcGraph.getEdgesFromKey(key):
-            edgesOfNeofunctionalisedECs.add(edge)
+    cladeEdgesForKey = cladeEcGraph.getEdgesForKey() # walks all edges only once, instead of once per key
+    edgesOfNeofunctionalisedECs = {edge for key in cladeNeofunctionalisedMetabolismSet for edge in cladeEdgesForKey.get(key, ())}
     Export.addColourAttribute(cladeEcGraph, Export.Colour.BLUE, nodes = False, edges = edgesOfNeofunctionalisedECs)
     
-    edgesOfContributingNeofunctionalisedECs = set()
-    for key in cladeRobustnessContributingNeofunctionalisedECs:
-        for edge in cladeEcGraph.getEdgesFromKey(key):
-            edgesOfContributingNeofunctionalisedECs.add(edge)
+    edgesOfContributingNeofunctionalisedECs = {edge for key in cladeRobustnessContributingNeofunctionalisedECs for edge in cladeEdgesForKey.get(key, ())}
     Export.addColourAttribute(cladeEcGraph, Export.Colour.GREEN, nodes = False, edges = edgesOfContributingNeofunctionalisedECs)
     
     Export.forCytoscape(cladeEcGraph, clade.ncbiNames[0], inCacheFolder = True, addDescriptions = True, totalNumberOfOrganisms = clade.organismsCount)
@@ -75,41 +72,36 @@ if __name__ == '__main__':
     
     
     #- report neofunctionalisations
-    neofunctionalisationsForFunctionChange = clade.neofunctionalisationsForFunctionChange(majorityPercentageCoreMetabolism, majorityPercentageNeofunctionalisation, eValue=eValue)
-    allNeofunctionalisations = set() # set of all neofunctionalisations, no matter which function change they belong to
-    for valueSet in neofunctionalisationsForFunctionChange.values():
-        allNeofunctionalisations.update( valueSet )
+    neofunctionalisationsForFunctionChange = cladeNeofunctionalisationsForFunctionChange # same arguments as above, do not compute again
+    allNeofunctionalisations = set().union( *neofunctionalisationsForFunctionChange.values() ) # set of all neofunctionalisations, no matter which function change they belong to
 
     output.append('')
     output.append('')
     output.append( 'All neofunctionalisations: ' + str(len(allNeofunctionalisations)) )
     
     #-     print them into nice HTML
-    ecNumbers = set()
-    for functionChange in neofunctionalisationsForFunctionChange.keys():
-        ecNumbers.update( functionChange.ecPair )
+    ecNumbers = set().union( *(functionChange.ecPair for functionChange in neofunctionalisationsForFunctionChange.keys()) )
     dictToHtmlFile(neofunctionalisationsForFunctionChange, clade.ncbiNames[0] + '_Neofunctionalisations-For-FunctionChange.html', byValueFirst=False, inCacheFolder=True, addEcDescriptions=ecNumbers)
     output.append( '\t[see ' + clade.ncbiNames[0] + '_Neofunctionalisations-For-FunctionChange.html]' )
     output.append('')
     
-    robustnessContributingNeofunctionalisations = dict()
+    robustnessContributingNeofunctionalisations = defaultdict(set)
+    neofunctionalisationsForContributedEC = defaultdict(set) # inverse of robustnessContributingNeofunctionalisations, filled in the same pass
     
     for functionChange, neofunctionalisations in cladeNeofunctionalisationsForFunctionChange.items():
         #-     report enzyme pairs of neofunctionalisations, which caused the EC to be considered "neofunctionalised", and are in return contributing to redundancy        
         
-        if functionChange.ecA in cladeRobustnessContributingNeofunctionalisedECs or functionChange.ecB in cladeRobustnessContributingNeofunctionalisedECs: # function change contributes to robustness
+        contributingECs = tuple(ec for ec in functionChange.ecPair if ec in cladeRobustnessContributingNeofunctionalisedECs)
+        if contributingECs: # function change contributes to robustness
             
             for neofunctionalisation in neofunctionalisations:
-                currentSetOfContributedECs = robustnessContributingNeofunctionalisations.get(neofunctionalisation, None)
+                currentSetOfContributedECs = robustnessContributingNeofunctionalisations[neofunctionalisation]
                 
-                if currentSetOfContributedECs is None:
-                    currentSetOfContributedECs = set()
-                    robustnessContributingNeofunctionalisations[neofunctionalisation] = currentSetOfContributedECs
-                
-                for ec in functionChange.ecPair:
-                    contributedECs = cladeRobustnessContributedECsForContributingNeofunctionalisedEC.get(ec, None)
-                    if contributedECs is not None:
-                        currentSetOfContributedECs.update(contributedECs)
+                for ec in contributingECs:
+                    contributedECs = cladeRobustnessContributedECsForContributingNeofunctionalisedEC[ec] # always present, contributingECs are its keys
+                    currentSetOfContributedECs.update(contributedECs)
+                    for contributedEC in contributedECs:
+                        neofunctionalisationsForContributedEC[contributedEC].add(neofunctionalisation)
     
     output.append('')
     output.append( 'Neofunctionalisations contributing to robustness: ' + str(len(robustnessContributingNeofunctionalisations)) + ' (' + str(Percent.getPercentStringShort(len(robustnessContributingNeofunctionalisations), len(allNeofunctionalisations), 0)) + '%)' )
@@ -118,28 +110,12 @@ if __name__ == '__main__':
     output.append('')
     
     
-    neofunctionalisationsForContributedEC = dict()
-    for neofunctionalisation, contributedECs in robustnessContributingNeofunctionalisations.items():
-        
-        for contributedEC in contributedECs:
-            
-            currentSetOfNeofunctionalisations = neofunctionalisationsForContributedEC.get(contributedEC, None)
-            
-            if currentSetOfNeofunctionalisations is None:
-                currentSetOfNeofunctionalisations = set()
-                neofunctionalisationsForContributedEC[contributedEC] = currentSetOfNeofunctionalisations
-                
-            currentSetOfNeofunctionalisations.add(neofunctionalisation)
-    
     #-         print them into nice HTML
-    ecNumbers = set()
-    for contributedEC in neofunctionalisationsForContributedEC.keys():
-        ecNumbers.add( contributedEC )
+    ecNumbers = set( neofunctionalisationsForContributedEC.keys() )
     
     dictToHtmlFile(neofunctionalisationsForContributedEC, clade.ncbiNames[0] + '_Neofunctionalisations-For-Contributed-EC.html', byValueFirst=False, inCacheFolder=True, addEcDescriptions=ecNumbers)
     
     
     
-    for line in output:
-        print( line )
+    sys.stdout.write( '\n'.join(output) + '\n' )
     
\ No newline at end of file
@@ -41,9 +41,10 @@ setup(
         'License :: OSI Approved :: MIT License',
 
         'Programming Language :: Python :: 3 :: Only',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         
         'Environment :: Console',
     ],
@@ -58,16 +59,14 @@ setup(
                       'tqdm',
                       'beautifulsoup4',
                       'retrying',
-                      'appdirs',
-                      'yattag'],
+                      'appdirs'],
     
     extras_require={  # Optional
-        'python34': ['typing'], # only required in Python == 3.4
         'draw_image': ['pygraphviz'],
         'draw_window': ['matplotlib'],
         },
     
-    python_requires='~=3.4', # Python >=3.4, but not 4.x
+    python_requires='~=3.8', # Python >=3.8, but not 4.x
 
     project_urls={  # Optional
         'Bug Reports': 'https://github.com/ryhaberecht/FEV-KEGG/issues',